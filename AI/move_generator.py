@@ -1,13 +1,21 @@
 # AI/move_generator.py 
 
-from collections import deque
+# Reusable BFS buffers for _has_path (sized on first use)
+_BFS_VISITED = []   # cell index -> generation that last visited it
+_BFS_QUEUE = []     # cell indices, consumed from a moving head
+_bfs_generation = 0
 
+# Pawn steps as (dy, dx, wall_dy, wall_dx); a blocked straight jump tries
+# the two steps across the jump direction instead
+PAWN_STEPS = ((-2, 0, -1, 0), (2, 0, 1, 0), (0, -2, 0, -1), (0, 2, 0, 1))
+VERTICAL_STEPS = PAWN_STEPS[:2]
+HORIZONTAL_STEPS = PAWN_STEPS[2:]
 
-def generate_all_moves(board, player):
-    """Generate all valid moves for a player on the real board."""
+def generate_all_moves(board, player, moves_mode='all'):
+    """Generate valid moves for a player on the real board ('pawn' mode skips walls)."""
     moves = []
     moves.extend(generate_pawn_moves(board, player))
-    if player.available_walls > 0:
+    if player.available_walls > 0 and moves_mode == 'all':
         moves.extend(generate_wall_moves(board, player))
     return moves
 
@@ -15,16 +23,14 @@ def generate_all_moves(board, player):
 def generate_pawn_moves(board, player):
     """Generate pawn moves on real board."""
     moves = []
-    y, x = player.pos
     dim = board.dimBoard
     grid = board.board
     
-    opponent = board.p1 if player == board.p2 else board.p2
-    oy, ox = opponent.pos
+    y, x = player.y, player.x
+    opponent = board.p2 if player is board.p1 else board.p1
+    oy, ox = opponent.y, opponent.x
     
-    directions = [(-2, 0, -1, 0), (2, 0, 1, 0), (0, -2, 0, -1), (0, 2, 0, 1)]
-    
-    for dy, dx, wy, wx in directions:
+    for dy, dx, wy, wx in PAWN_STEPS:
         ny, nx = y + dy, x + dx
         wall_y, wall_x = y + wy, x + wx
         
@@ -46,10 +52,7 @@ def generate_pawn_moves(board, player):
                 moves.append(("pawn", (jy, jx)))
             else:
                 # Diagonal jumps
-                if dy != 0:
-                    sides = [(0, -2, 0, -1), (0, 2, 0, 1)]
-                else:
-                    sides = [(-2, 0, -1, 0), (2, 0, 1, 0)]
+                sides = HORIZONTAL_STEPS if dy != 0 else VERTICAL_STEPS
                 
                 for sdy, sdx, swy, swx in sides:
                     sy, sx = ny + sdy, nx + sdx
@@ -110,31 +113,67 @@ def _paths_exist_after_wall(board, cells):
 
 
 def _has_path(board, player):
-    """BFS to check if player can reach goal."""
-    start = tuple(player.pos)
+    """
+    BFS to check if player can reach goal.
+    
+    Visited cells and the queue live in module-level buffers reused across
+    calls: a cell counts as visited when its stamp equals this call's
+    generation, so nothing is allocated or cleared per search.
+    """
+    global _bfs_generation
+    
     target = player.objective
     dim = board.dimBoard
     grid = board.board
     
-    visited = set([start])
-    queue = deque([start])
-    directions = [(-2, 0, -1, 0), (2, 0, 1, 0), (0, -2, 0, -1), (0, 2, 0, 1)]
+    cells = dim * dim
+    if len(_BFS_VISITED) < cells:
+        _BFS_VISITED[:] = [0] * cells
+        _BFS_QUEUE[:] = [0] * cells
+    
+    _bfs_generation += 1
+    generation = _bfs_generation
+    visited = _BFS_VISITED
+    queue = _BFS_QUEUE
     
-    while queue:
-        y, x = queue.popleft()
+    start = player.y * dim + player.x
+    visited[start] = generation
+    queue[0] = start
+    head, tail = 0, 1
+    row_step = dim * 2
+    last = dim - 3
+    
+    while head < tail:
+        idx = queue[head]
+        head += 1
+        y, x = divmod(idx, dim)
         if y == target:
             return True
         
-        for dy, dx, wy, wx in directions:
-            ny, nx = y + dy, x + dx
-            wall_y, wall_x = y + wy, x + wx
-            
-            if not (0 <= ny < dim and 0 <= nx < dim):
-                continue
-            if grid[wall_y, wall_x] != 0:
-                continue
-            if (ny, nx) not in visited:
-                visited.add((ny, nx))
-                queue.append((ny, nx))
+        # Up / down / left / right, unrolled with the bounds folded in
+        if y >= 2 and grid[y - 1, x] == 0:
+            n = idx - row_step
+            if visited[n] != generation:
+                visited[n] = generation
+                queue[tail] = n
+                tail += 1
+        if y <= last and grid[y + 1, x] == 0:
+            n = idx + row_step
+            if visited[n] != generation:
+                visited[n] = generation
+                queue[tail] = n
+                tail += 1
+        if x >= 2 and grid[y, x - 1] == 0:
+            n = idx - 2
+            if visited[n] != generation:
+                visited[n] = generation
+                queue[tail] = n
+                tail += 1
+        if x <= last and grid[y, x + 1] == 0:
+            n = idx + 2
+            if visited[n] != generation:
+                visited[n] = generation
+                queue[tail] = n
+                tail += 1
     
-    return False
\ No newline at end of file
+    return False
@@ -1,8 +1,8 @@
 # AI/search.py - OPTIMIZED with smart wall selection
 
 import math
-import heapq
-from collections import deque, Counter
+import random
+from collections import Counter
 
 
 # Move codes
@@ -13,10 +13,174 @@ HORIZONTAL_CONNECTOR_CODE = 3
 
 # Performance tuning
 MAX_WALL_CANDIDATES = 30  # Evaluate top N strategic walls
+ASPIRATION_WINDOW = 8     # Root search window around the previous iteration's score
+NULL_MOVE_REDUCTION = 2   # Extra plies cut from the search after a passed turn
+NULL_MOVE_MIN_DEPTH = 2   # Shallowest remaining depth that tries a null move
+QUIESCENCE_DEPTH = 2      # Extra pawn-only plies at leaves where a pawn is near its goal
 
+# Pawn steps as (dy, dx, wall_dy, wall_dx), and the sideways jumps used
+# when a straight jump is blocked, as (d, wall_d) pairs
+PAWN_STEPS = ((-2, 0, -1, 0), (2, 0, 1, 0), (0, -2, 0, -1), (0, 2, 0, 1))
+SIDE_STEPS = ((-2, -1), (2, 1))
 
+# Transposition table entry flags
+TT_EXACT = 0
+TT_LOWER = 1
+TT_UPPER = 2
 
+# Upper bound on walls held by one player (sizes the Zobrist wall-count keys)
+ZOBRIST_MAX_WALLS = 32
 
+_ZOBRIST_KEYS = {}          # dim -> (pos_keys, wall_keys, wall_count_keys, side_key)
+_BIT_MASKS = {}             # dim -> (cell_mask, row_masks)
+_WALL_CONTACTS = {}         # dim -> {wall cells: contact masks of its 3 lattice points}
+_WALL_SLOTS = {}            # dim -> [(y, x, center_bit, h_move, h_mask, v_move, v_mask)]
+_TRANSPOSITION_TABLE = {}   # hash -> (depth, flag, value, best_move)
+_KILLER_MOVES = {}          # depth -> [newest, older] moves that caused a cutoff
+_HISTORY_SCORES = ({}, {})  # per player index: move -> accumulated cutoff score
+_DISTANCE_FIELDS = {}       # (wall_bits, goal_row) -> steps to the goal row per cell index
+_REPEAT_PENALTIES = {}      # (y, x) -> penalty for the AI revisiting that cell
+_FREE_WALL_SLOTS = {}       # wall_bits -> [(y, x, free h_move or None, free v_move or None)]
+_REACHABLE_CACHE = {}       # (wall_bits, p1 index, p2 index) -> both goals reachable
+_WALL_PRIORITIES = {}       # (maximizing, mover_y, mover_x, opp_y, opp_x) -> priority per wall center index
+_NEIGHBOR_CACHE = {}        # wall_bits -> per cell index, tuple of open neighbor indices
+_PATH_WALL_CENTERS = {}     # (wall_bits, start_index, goal_row) -> (h centers, v centers) cutting a shortest path
+
+
+# =============================================================================
+# ZOBRIST HASHING
+# =============================================================================
+
+def _zobrist_keys(dim):
+    """Random 64-bit keys for hashing virtual boards of the given size."""
+    keys = _ZOBRIST_KEYS.get(dim)
+    if keys is None:
+        rng = random.Random(dim)
+        cells = dim * dim
+        pos_keys = [[rng.getrandbits(64) for _ in range(cells)] for _ in range(2)]
+        wall_keys = [rng.getrandbits(64) for _ in range(cells)]
+        wall_count_keys = [[rng.getrandbits(64) for _ in range(ZOBRIST_MAX_WALLS + 1)]
+                           for _ in range(2)]
+        side_key = rng.getrandbits(64)
+        keys = (pos_keys, wall_keys, wall_count_keys, side_key)
+        _ZOBRIST_KEYS[dim] = keys
+    return keys
+
+
+def _hash_virtual_board(virtual_board, dim):
+    """Full Zobrist hash of a virtual board (AI to move)."""
+    pos_keys, wall_keys, wall_count_keys, _ = _zobrist_keys(dim)
+    grid = virtual_board[2]
+
+    h = 0
+    for idx in (0, 1):
+        (y, x), walls = virtual_board[idx]
+        h ^= pos_keys[idx][int(y) * dim + int(x)]
+        h ^= wall_count_keys[idx][walls]
+
+    # Wall cells are the ones where exactly one coordinate is odd, or connectors
+    for y in range(dim):
+        for x in range(dim):
+            if (y % 2 or x % 2) and grid[y][x]:
+                h ^= wall_keys[y * dim + x]
+
+    return h
+
+
+# =============================================================================
+# WALL BITBOARDS
+# =============================================================================
+#
+# Bit y * dim + x of a wall bitboard is set when grid cell (y, x) holds a
+# wall segment or connector. Pawn cells are the even/even indices; moving
+# between two of them is blocked when the bit in between is set.
+
+def _bit_masks(dim):
+    """Masks of all pawn cells and of the pawn cells on each grid row."""
+    masks = _BIT_MASKS.get(dim)
+    if masks is None:
+        row_masks = [0] * dim
+        for y in range(0, dim, 2):
+            for x in range(0, dim, 2):
+                row_masks[y] |= 1 << (y * dim + x)
+        cell_mask = 0
+        for row in row_masks:
+            cell_mask |= row
+        masks = (cell_mask, row_masks)
+        _BIT_MASKS[dim] = masks
+    return masks
+
+
+def _wall_bits_from_grid(grid, dim):
+    """Build the wall bitboard of a list-of-lists grid."""
+    bits = 0
+    for y in range(dim):
+        row = grid[y]
+        for x in range(dim):
+            if (y % 2 or x % 2) and row[x]:
+                bits |= 1 << (y * dim + x)
+    return bits
+
+
+def _paths_open_bits(wall_bits, p1_start, p1_goal, p2_start, p2_goal, dim):
+    """
+    Flood-fill check that both pawns can still reach their goal rows.
+    
+    Expands each whole BFS frontier at once with shifts and masks instead
+    of visiting cells one by one. Both fills advance in the same loop and
+    share the open-move masks, which only depend on the walls.
+    """
+    cell_mask, row_masks = _bit_masks(dim)
+    goal1 = row_masks[p1_goal]
+    goal2 = row_masks[p2_goal]
+    frontier1 = 1 << (int(p1_start[0]) * dim + int(p1_start[1]))
+    frontier2 = 1 << (int(p2_start[0]) * dim + int(p2_start[1]))
+    
+    # A fill that has already reached its goal row is dropped
+    if frontier1 & goal1:
+        frontier1 = 0
+    if frontier2 & goal2:
+        frontier2 = 0
+    if not (frontier1 or frontier2):
+        return True
+    
+    # Cells whose move in each direction is not blocked by a wall
+    up_open = cell_mask & ~(wall_bits << dim)
+    down_open = cell_mask & ~(wall_bits >> dim)
+    left_open = cell_mask & ~(wall_bits << 1)
+    right_open = cell_mask & ~(wall_bits >> 1)
+    
+    row_step = dim * 2
+    unvisited1 = cell_mask & ~frontier1
+    unvisited2 = cell_mask & ~frontier2
+    done1 = not frontier1
+    done2 = not frontier2
+    
+    while True:
+        if not done1:
+            frontier1 = (((frontier1 & up_open) >> row_step) |
+                         ((frontier1 & down_open) << row_step) |
+                         ((frontier1 & left_open) >> 2) |
+                         ((frontier1 & right_open) << 2)) & unvisited1
+            if frontier1 & goal1:
+                if done2:
+                    return True
+                done1 = True
+            elif not frontier1:
+                return False
+            unvisited1 ^= frontier1
+        if not done2:
+            frontier2 = (((frontier2 & up_open) >> row_step) |
+                         ((frontier2 & down_open) << row_step) |
+                         ((frontier2 & left_open) >> 2) |
+                         ((frontier2 & right_open) << 2)) & unvisited2
+            if frontier2 & goal2:
+                if done1:
+                    return True
+                done2 = True
+            elif not frontier2:
+                return False
+            unvisited2 ^= frontier2
 
 
 # =============================================================================
@@ -24,51 +188,104 @@ MAX_WALL_CANDIDATES = 30  # Evaluate top N strategic walls
 # =============================================================================
 
 def _create_virtual_board(board):
-    """Create virtual board state for search."""
+    """
+    Create virtual board state for search:
+    [
+        [p1_position, p1_walls],
+        [p2_position, p2_walls],
+        grid,
+        zobrist_hash,
+        wall_bits
+    ]
+    """
     dim = board.dimBoard
-    grid_copy = [[board.board[y, x] for x in range(dim)] for y in range(dim)]
-    
-    return [
-        [[int(board.p1.pos[0]), int(board.p1.pos[1])], board.p1.available_walls],
-        [[int(board.p2.pos[0]), int(board.p2.pos[1])], board.p2.available_walls],
-        grid_copy
+    # tolist() copies in C and yields plain ints, which index faster than numpy
+    grid_copy = board.board.tolist()
+    
+    virtual_board = [
+        [[board.p1.y, board.p1.x], board.p1.available_walls],
+        [[board.p2.y, board.p2.x], board.p2.available_walls],
+        grid_copy,
+        0,
+        _wall_bits_from_grid(grid_copy, dim)
     ]
+    virtual_board[3] = _hash_virtual_board(virtual_board, dim)
+    return virtual_board
 
 
-def _apply_move_virtual(board, virtual_board, move, maximizing):
-    """Apply move to virtual board and return new state."""
-    new_virtual_board = [
-        [virtual_board[0][0].copy(), virtual_board[0][1]],
-        [virtual_board[1][0].copy(), virtual_board[1][1]],
-        [row.copy() for row in virtual_board[2]]
-    ]
+def _make_move_virtual(board, virtual_board, move, maximizing):
+    """
+    Apply move to the virtual board in place.
+    
+    Returns the undo record _unmake_move_virtual needs to restore the
+    previous state; only the cells the move touched are written back.
+    """
+    dim = board.dimBoard
+    pos_keys, wall_keys, wall_count_keys, side_key = _zobrist_keys(dim)
     
     player_idx = 1 if maximizing else 0
-    player_id = board.p2.id if maximizing else board.p1.id
+    player_state = virtual_board[player_idx]
+    grid = virtual_board[2]
+    undo = (player_idx, player_state, virtual_board[3], virtual_board[4], move)
     
     move_type, move_data = move
     
     if move_type == PAWN_MOVE_CODE:
-        old_pos = virtual_board[player_idx][0]
-        new_virtual_board[2][old_pos[0]][old_pos[1]] = 0
-        
+        old_y, old_x = player_state[0]
         new_y, new_x = int(move_data[0]), int(move_data[1])
-        new_virtual_board[player_idx][0] = [new_y, new_x]
-        new_virtual_board[2][new_y][new_x] = player_id
+        
+        grid[old_y][old_x] = 0
+        grid[new_y][new_x] = board.p2.id if maximizing else board.p1.id
+        
+        virtual_board[player_idx] = [[new_y, new_x], player_state[1]]
+        virtual_board[3] ^= (side_key ^
+                             pos_keys[player_idx][old_y * dim + old_x] ^
+                             pos_keys[player_idx][new_y * dim + new_x])
     else:
         coord1, coord2, coord3 = move_data
         
-        new_virtual_board[2][coord1[0]][coord1[1]] = 1
-        new_virtual_board[2][coord3[0]][coord3[1]] = 1
+        grid[coord1[0]][coord1[1]] = 1
+        grid[coord3[0]][coord3[1]] = 1
         
         if coord1[0] == coord2[0]:
-            new_virtual_board[2][coord2[0]][coord2[1]] = HORIZONTAL_CONNECTOR_CODE
+            grid[coord2[0]][coord2[1]] = HORIZONTAL_CONNECTOR_CODE
         else:
-            new_virtual_board[2][coord2[0]][coord2[1]] = VERTICAL_CONNECTOR_CODE
+            grid[coord2[0]][coord2[1]] = VERTICAL_CONNECTOR_CODE
         
-        new_virtual_board[player_idx][1] -= 1
+        walls = player_state[1]
+        virtual_board[player_idx] = [player_state[0], walls - 1]
+        virtual_board[3] ^= (side_key ^
+                             wall_keys[coord1[0] * dim + coord1[1]] ^
+                             wall_keys[coord2[0] * dim + coord2[1]] ^
+                             wall_keys[coord3[0] * dim + coord3[1]] ^
+                             wall_count_keys[player_idx][walls] ^
+                             wall_count_keys[player_idx][walls - 1])
+        wall_bits = virtual_board[4]
+        virtual_board[4] = wall_bits | _wall_mask(move_data, dim)
+        _extend_neighbor_table(wall_bits, virtual_board[4], move_data, dim)
+        _inherit_distance_fields(wall_bits, virtual_board[4], move_data, dim,
+                                 (board.p1.objective, board.p2.objective))
+    
+    return undo
+
+
+def _unmake_move_virtual(virtual_board, undo):
+    """Revert a move applied by _make_move_virtual."""
+    player_idx, player_state, zobrist_hash, wall_bits, move = undo
+    grid = virtual_board[2]
+    
+    if move[0] == PAWN_MOVE_CODE:
+        new_y, new_x = virtual_board[player_idx][0]
+        old_y, old_x = player_state[0]
+        grid[old_y][old_x] = grid[new_y][new_x]
+        grid[new_y][new_x] = 0
+    else:
+        for y, x in move[1]:
+            grid[y][x] = 0
     
-    return new_virtual_board
+    virtual_board[player_idx] = player_state
+    virtual_board[3] = zobrist_hash
+    virtual_board[4] = wall_bits
 
 
 def apply_move_to_board(board, move, player):
@@ -77,10 +294,11 @@ def apply_move_to_board(board, move, player):
     grid = board.board
     
     if move_type == PAWN_MOVE_CODE:
-        grid[player.pos[0], player.pos[1]] = 0
+        grid[player.y, player.x] = 0
         
         new_y, new_x = int(move_data[0]), int(move_data[1])
-        player.pos = [new_y, new_x]
+        player.y = new_y
+        player.x = new_x
         grid[new_y, new_x] = player.id
     else:
         coord1, coord2, coord3 = move_data
@@ -100,88 +318,134 @@ def apply_move_to_board(board, move, player):
 # PATHFINDING
 # =============================================================================
 
-def _astar_path(virtual_board, start_pos, target_row, dim):
-    """A* pathfinding to find shortest path to goal row."""
-    grid = virtual_board[2]
-    
-    start_y = int(start_pos[0])
-    start_x = int(start_pos[1])
-    
-    if start_y == target_row:
-        return 0
-    
-    visited = set()
-    heap = [(abs(start_y - target_row), 0, start_y, start_x)]
-    
-    directions = [(-2, 0, -1, 0), (2, 0, 1, 0), (0, -2, 0, -1), (0, 2, 0, 1)]
+def _distance_field(virtual_board, goal_row, dim):
+    """
+    Steps from every pawn cell to the goal row (math.inf if cut off).
     
-    while heap:
-        f, g, y, x = heapq.heappop(heap)
-        
-        if y == target_row:
-            return g
+    One breadth-first search seeded with the whole goal row answers every
+    path query on the same walls. Pawns do not block, so the field only
+    depends on the wall layout and is memoized on it for the current search.
+    """
+    key = (virtual_board[4], goal_row)
+    field = _DISTANCE_FIELDS.get(key)
+    if field is None:
+        neighbors = _neighbor_table(virtual_board, dim)
+        field = [math.inf] * (dim * dim)
+        frontier = list(range(goal_row * dim, goal_row * dim + dim, 2))
+        for idx in frontier:
+            field[idx] = 0
         
-        if (y, x) in visited:
-            continue
-        visited.add((y, x))
+        steps = 0
+        while frontier:
+            steps += 1
+            next_frontier = []
+            for idx in frontier:
+                for n in neighbors[idx]:
+                    if field[n] == math.inf:
+                        field[n] = steps
+                        next_frontier.append(n)
+            frontier = next_frontier
         
-        for dy, dx, wy, wx in directions:
-            ny, nx = y + dy, x + dx
-            wall_y, wall_x = y + wy, x + wx
-            
-            if 0 <= ny < dim and 0 <= nx < dim:
-                if 0 <= wall_y < dim and 0 <= wall_x < dim:
-                    if not grid[wall_y][wall_x] and (ny, nx) not in visited:
-                        h = abs(ny - target_row)
-                        heapq.heappush(heap, (g + 1 + h, g + 1, ny, nx))
-    
-    return math.inf
+        _DISTANCE_FIELDS[key] = field
+    return field
 
 
-def _has_path_fast(grid, start, goal_row, dim):
-    """Fast BFS path check."""
-    start_y, start_x = int(start[0]), int(start[1])
-    
-    if start_y == goal_row:
-        return True
+def _neighbor_table(virtual_board, dim):
+    """
+    For every pawn cell, the cells one step away that no wall blocks.
     
-    visited = set()
-    visited.add((start_y, start_x))
-    queue = deque([(start_y, start_x)])
+    Walls only change on wall moves, so the table is built once per wall
+    layout in a search and shared by every distance field on it. Layouts
+    reached by a wall move are usually derived from their parent's table
+    by _extend_neighbor_table instead.
+    """
+    wall_bits = virtual_board[4]
+    neighbors = _NEIGHBOR_CACHE.get(wall_bits)
+    if neighbors is None:
+        grid = virtual_board[2]
+        row_step = dim * 2
+        last = dim - 3
+        neighbors = [()] * (dim * dim)
+        for y in range(0, dim, 2):
+            row = grid[y]
+            for x in range(0, dim, 2):
+                idx = y * dim + x
+                open_cells = []
+                if y >= 2 and not grid[y - 1][x]:
+                    open_cells.append(idx - row_step)
+                if y <= last and not grid[y + 1][x]:
+                    open_cells.append(idx + row_step)
+                if x >= 2 and not row[x - 1]:
+                    open_cells.append(idx - 2)
+                if x <= last and not row[x + 1]:
+                    open_cells.append(idx + 2)
+                neighbors[idx] = tuple(open_cells)
+        _NEIGHBOR_CACHE[wall_bits] = neighbors
+    return neighbors
+
+
+def _extend_neighbor_table(parent_bits, wall_bits, cells, dim):
+    """Derive the neighbor table for `wall_bits` from its parent layout's, if cached."""
+    parent = _NEIGHBOR_CACHE.get(parent_bits)
+    if parent is None or wall_bits in _NEIGHBOR_CACHE:
+        return
+    
+    neighbors = parent.copy()
+    for seg_y, seg_x in (cells[0], cells[2]):
+        if seg_y % 2:
+            a, b = (seg_y - 1) * dim + seg_x, (seg_y + 1) * dim + seg_x
+        else:
+            a, b = seg_y * dim + seg_x - 1, seg_y * dim + seg_x + 1
+        neighbors[a] = tuple(n for n in neighbors[a] if n != b)
+        neighbors[b] = tuple(n for n in neighbors[b] if n != a)
+    _NEIGHBOR_CACHE[wall_bits] = neighbors
+
+
+def _inherit_distance_fields(parent_bits, wall_bits, cells, dim, goal_rows):
+    """
+    Share the parent layout's distance fields with `wall_bits` when the new
+    wall cannot have lengthened any path.
     
-    directions = [(-2, 0, -1, 0), (2, 0, 1, 0), (0, -2, 0, -1), (0, 2, 0, 1)]
+    A wall only removes two steps. Distances never shrink, and a cell keeps
+    its distance as long as some open neighbor is still one step closer to
+    the goal, so the field survives if that holds for the far end of every
+    removed step.
+    """
+    neighbors = _NEIGHBOR_CACHE.get(wall_bits)
+    if neighbors is None:
+        return
     
-    while queue:
-        y, x = queue.popleft()
+    for goal_row in goal_rows:
+        field = _DISTANCE_FIELDS.get((parent_bits, goal_row))
+        if field is None or (wall_bits, goal_row) in _DISTANCE_FIELDS:
+            continue
         
-        for dy, dx, wy, wx in directions:
-            ny, nx = y + dy, x + dx
-            wall_y, wall_x = y + wy, x + wx
-            
-            if not (0 <= ny < dim and 0 <= nx < dim):
-                continue
-            if not (0 <= wall_y < dim and 0 <= wall_x < dim):
-                continue
-            if grid[wall_y][wall_x]:
-                continue
-            if (ny, nx) in visited:
+        for seg_y, seg_x in (cells[0], cells[2]):
+            if seg_y % 2:
+                a, b = (seg_y - 1) * dim + seg_x, (seg_y + 1) * dim + seg_x
+            else:
+                a, b = seg_y * dim + seg_x - 1, seg_y * dim + seg_x + 1
+            if field[a] == field[b]:
                 continue
-            
-            if ny == goal_row:
-                return True
-            
-            visited.add((ny, nx))
-            queue.append((ny, nx))
-    
-    return False
+            far = a if field[a] > field[b] else b
+            closer = field[far] - 1
+            if not any(field[n] == closer for n in neighbors[far]):
+                break
+        else:
+            _DISTANCE_FIELDS[(wall_bits, goal_row)] = field
 
 
 # =============================================================================
 # MOVE GENERATION
 # =============================================================================
 
-def _get_valid_moves_virtual(board, virtual_board, maximizing):
-    """Generate all valid moves for current player."""
+def _get_valid_moves_virtual(board, virtual_board, maximizing, moves_mode='all', validate_walls=True):
+    """
+    Generate valid moves for current player ('pawn' mode skips walls).
+    
+    With validate_walls=False, wall candidates are returned without the
+    path check; the caller must run _wall_valid_fast before playing one.
+    """
     moves = []
     dim = board.dimBoard
     grid = virtual_board[2]
@@ -196,10 +460,8 @@ def _get_valid_moves_virtual(board, virtual_board, maximizing):
     py, px = int(py), int(px)
     oy, ox = int(oy), int(ox)
     
-    directions = [(-2, 0, -1, 0), (2, 0, 1, 0), (0, -2, 0, -1), (0, 2, 0, 1)]
-    
     # Generate pawn moves
-    for dy, dx, wy, wx in directions:
+    for dy, dx, wy, wx in PAWN_STEPS:
         ny, nx = py + dy, px + dx
         wall_y, wall_x = py + wy, px + wx
         
@@ -221,14 +483,14 @@ def _get_valid_moves_virtual(board, virtual_board, maximizing):
             
             # Diagonal jumps
             if dy != 0:
-                for sdx, swx in [(-2, -1), (2, 1)]:
+                for sdx, swx in SIDE_STEPS:
                     sy, sx = ny, nx + sdx
                     swy, swx_pos = ny, nx + swx
                     if (0 <= sx < dim and 0 <= swx_pos < dim and
                         not grid[swy][swx_pos] and not grid[sy][sx]):
                         moves.append((PAWN_MOVE_CODE, (sy, sx)))
             else:
-                for sdy, swy in [(-2, -1), (2, 1)]:
+                for sdy, swy in SIDE_STEPS:
                     sy, sx = ny + sdy, nx
                     swy_pos, swx = ny + swy, nx
                     if (0 <= sy < dim and 0 <= swy_pos < dim and
@@ -239,100 +501,146 @@ def _get_valid_moves_virtual(board, virtual_board, maximizing):
                 moves.append((PAWN_MOVE_CODE, (ny, nx)))
     
     # Generate wall moves with smart selection
-    if remaining_walls > 0:
-        wall_moves = _get_wall_moves_smart(virtual_board, dim, board, maximizing)
+    if remaining_walls > 0 and moves_mode == 'all':
+        wall_moves = _get_wall_moves_smart(virtual_board, dim, board, maximizing, validate_walls)
         moves.extend(wall_moves)
     
     return moves
 
 
-def _get_wall_moves_smart(virtual_board, dim, board, maximizing):
+def _get_wall_moves_smart(virtual_board, dim, board, maximizing, validate=True):
     """
     Generate wall placements prioritized by strategic value.
     Considers walls that:
     1. Block opponent's path to their goal
     2. Are near the action (both players)
-    3. Protect AI's path
+    3. Protect the mover's own path
     """
-    grid = virtual_board[2]
+    wall_bits = virtual_board[4]
     p1_goal = board.p1.objective
     p2_goal = board.p2.objective
     
-    # Positions
-    ai_y, ai_x = virtual_board[1][0]
-    opp_y, opp_x = virtual_board[0][0]
+    # Positions and goals of the side placing the wall and of its opponent
+    mover_idx, opp_idx = (1, 0) if maximizing else (0, 1)
+    mover_goal, opp_goal = (p2_goal, p1_goal) if maximizing else (p1_goal, p2_goal)
+    mover_y, mover_x = virtual_board[mover_idx][0]
+    opp_y, opp_x = virtual_board[opp_idx][0]
     
-    ai_y, ai_x = int(ai_y), int(ai_x)
+    mover_y, mover_x = int(mover_y), int(mover_x)
     opp_y, opp_x = int(opp_y), int(opp_x)
     
     candidates = []
     
-    for y in range(1, dim - 1, 2):
-        for x in range(1, dim - 1, 2):
-            if grid[y][x]:
-                continue
-            
-            # Calculate strategic priority (lower = better)
-            priority = _calculate_wall_priority(
-                y, x, ai_y, ai_x, opp_y, opp_x, p1_goal, p2_goal
+    # Strategic priority per center (lower = better) only depends on the pawns
+    priority_key = (maximizing, mover_y, mover_x, opp_y, opp_x)
+    priorities = _WALL_PRIORITIES.get(priority_key)
+    if priorities is None:
+        priorities = [0] * (dim * dim)
+        for y, x, _, _, _, _, _ in _wall_slots(dim):
+            priorities[y * dim + x] = _calculate_wall_priority(
+                y, x, mover_y, mover_x, opp_y, opp_x, mover_goal, opp_goal
             )
-            
-            # Horizontal wall
-            if x - 1 >= 0 and x + 1 < dim:
-                cells = ((y, x - 1), (y, x), (y, x + 1))
-                if not any(grid[cy][cx] for cy, cx in cells):
-                    # Horizontal walls block vertical movement
-                    # Better for blocking opponent moving up/down
-                    h_priority = priority
-                    if p1_goal == 0:  # Opponent moving up
-                        h_priority -= 5  # Horizontal walls help
-                    else:
-                        h_priority -= 5
-                    candidates.append((h_priority, cells))
-            
-            # Vertical wall
-            if y - 1 >= 0 and y + 1 < dim:
-                cells = ((y - 1, x), (y, x), (y + 1, x))
-                if not any(grid[cy][cx] for cy, cx in cells):
-                    candidates.append((priority, cells))
+        _WALL_PRIORITIES[priority_key] = priorities
+    
+    # Only walls across one of the opponent's shortest paths can lengthen it
+    h_centers, v_centers = _path_wall_centers(
+        virtual_board, opp_y * dim + opp_x, opp_goal, dim
+    )
+    
+    for y, x, h_move, v_move in _free_wall_slots(wall_bits, dim):
+        center = y * dim + x
+        priority = priorities[center]
+        
+        # Horizontal wall
+        if h_move is not None and center in h_centers:
+            # Horizontal walls block vertical movement
+            # Better for blocking opponent moving up/down
+            candidates.append((priority - 5, h_move))
+        
+        # Vertical wall
+        if v_move is not None and center in v_centers:
+            candidates.append((priority, v_move))
     
     # Sort by priority and take top candidates
     candidates.sort(key=lambda c: c[0])
     candidates = candidates[:MAX_WALL_CANDIDATES]
     
+    if not validate:
+        return [move for priority, move in candidates]
+    
     # Validate only top candidates
     moves = []
-    for priority, cells in candidates:
-        if _wall_valid_fast(virtual_board, cells, dim, p1_goal, p2_goal):
-            moves.append((WALL_MOVE_CODE, cells))
+    for priority, move in candidates:
+        if _wall_valid_fast(virtual_board, move[1], dim, p1_goal, p2_goal):
+            moves.append(move)
     
     return moves
 
 
-def _calculate_wall_priority(wall_y, wall_x, ai_y, ai_x, opp_y, opp_x, p1_goal, p2_goal):
+def _path_wall_centers(virtual_board, start, goal_row, dim):
+    """
+    Centers of the horizontal and vertical walls that would block a step
+    on some shortest path from `start` to the goal row.
+    
+    Every shortest path steps down the goal's distance field one unit at a
+    time, so following all such steps from the start visits exactly the
+    cells and steps on those paths. Memoized per wall layout and start.
+    """
+    key = (virtual_board[4], start, goal_row)
+    centers = _PATH_WALL_CENTERS.get(key)
+    if centers is None:
+        field = _distance_field(virtual_board, goal_row, dim)
+        neighbors = _neighbor_table(virtual_board, dim)
+        row_step = dim * 2
+        h_centers = set()
+        v_centers = set()
+        seen = {start}
+        stack = [start]
+        while stack:
+            idx = stack.pop()
+            closer = field[idx] - 1
+            for n in neighbors[idx]:
+                if field[n] != closer:
+                    continue
+                y, x = divmod(min(idx, n), dim)
+                if abs(n - idx) == row_step:
+                    # Vertical step: a horizontal wall just below the upper cell
+                    h_centers.add((y + 1) * dim + x - 1)
+                    h_centers.add((y + 1) * dim + x + 1)
+                else:
+                    # Horizontal step: a vertical wall just right of the left cell
+                    v_centers.add((y - 1) * dim + x + 1)
+                    v_centers.add((y + 1) * dim + x + 1)
+                if n not in seen:
+                    seen.add(n)
+                    stack.append(n)
+        centers = (h_centers, v_centers)
+        _PATH_WALL_CENTERS[key] = centers
+    return centers
+
+
+def _calculate_wall_priority(wall_y, wall_x, mover_y, mover_x, opp_y, opp_x, mover_goal, opp_goal):
     """
-    Calculate strategic priority for a wall position.
+    Calculate strategic priority for a wall placed by the mover.
     Lower priority = more valuable wall.
     """
     # Distance to opponent
     dist_to_opp = abs(wall_y - opp_y) + abs(wall_x - opp_x)
     
-    # Distance to AI
-    dist_to_ai = abs(wall_y - ai_y) + abs(wall_x - ai_x)
+    # Distance to the mover
+    dist_to_mover = abs(wall_y - mover_y) + abs(wall_x - mover_x)
     
     # Is wall between opponent and their goal?
-    if p1_goal == 0:  # Opponent moving up (decreasing row)
+    if opp_goal == 0:  # Opponent moving up (decreasing row)
         blocks_opponent_path = wall_y < opp_y
-        between_opp_and_goal = wall_y < opp_y
     else:  # Opponent moving down (increasing row)
         blocks_opponent_path = wall_y > opp_y
-        between_opp_and_goal = wall_y > opp_y
     
-    # Is wall between AI and AI's goal?
-    if p2_goal == 16:  # AI moving down
-        helps_ai = wall_y < ai_y  # Wall behind AI doesn't block us
-    else:  # AI moving up
-        helps_ai = wall_y > ai_y
+    # Is wall behind the mover, clear of its own path?
+    if mover_goal == 0:  # Mover moving up
+        helps_mover = wall_y > mover_y
+    else:  # Mover moving down
+        helps_mover = wall_y < mover_y  # Wall behind the mover doesn't block it
     
     # Calculate priority
     priority = 0
@@ -350,34 +658,128 @@ def _calculate_wall_priority(wall_y, wall_x, ai_y, ai_x, opp_y, opp_x, p1_goal,
         priority = 50 + dist_to_opp
     
     # Avoid walls that might block our own path
-    if not helps_ai and dist_to_ai <= 4:
+    if not helps_mover and dist_to_mover <= 4:
         priority += 20
     
     # Walls near center of action (between players) are good
-    mid_y = (ai_y + opp_y) // 2
+    mid_y = (mover_y + opp_y) // 2
     dist_to_mid = abs(wall_y - mid_y)
     priority += dist_to_mid // 2
     
     return priority
 
 
-def _wall_valid_fast(virtual_board, cells, dim, p1_goal, p2_goal):
-    """Check if wall placement leaves valid paths for both players."""
-    grid = virtual_board[2]
+def _wall_slots(dim):
+    """
+    Every wall center with the move and bitboard mask of the horizontal
+    and vertical wall through it, so free slots are found with bit tests.
+    
+    The move tuples are built once here and shared by every generation,
+    so search nodes neither allocate them nor hash fresh copies.
+    """
+    slots = _WALL_SLOTS.get(dim)
+    if slots is None:
+        slots = []
+        for y in range(1, dim - 1, 2):
+            for x in range(1, dim - 1, 2):
+                h_cells = ((y, x - 1), (y, x), (y, x + 1))
+                v_cells = ((y - 1, x), (y, x), (y + 1, x))
+                slots.append((y, x, 1 << (y * dim + x),
+                              (WALL_MOVE_CODE, h_cells), _wall_mask(h_cells, dim),
+                              (WALL_MOVE_CODE, v_cells), _wall_mask(v_cells, dim)))
+        _WALL_SLOTS[dim] = slots
+    return slots
+
+
+def _free_wall_slots(wall_bits, dim):
+    """
+    Wall centers still open on a wall bitboard, with the moves of the
+    horizontal and vertical wall that fit there (None when blocked).
     
-    # Temporarily place wall
+    Only the walls decide this, so the list is memoized per bitboard for
+    the current search.
+    """
+    free = _FREE_WALL_SLOTS.get(wall_bits)
+    if free is None:
+        free = []
+        for y, x, center_bit, h_move, h_mask, v_move, v_mask in _wall_slots(dim):
+            if wall_bits & center_bit:
+                continue
+            free.append((y, x,
+                         None if wall_bits & h_mask else h_move,
+                         None if wall_bits & v_mask else v_move))
+        _FREE_WALL_SLOTS[wall_bits] = free
+    return free
+
+
+def _wall_mask(cells, dim):
+    """Bitboard of the three grid cells covered by a wall."""
+    mask = 0
     for cy, cx in cells:
-        grid[cy][cx] = 1
+        mask |= 1 << (cy * dim + cx)
+    return mask
+
+
+def _wall_contacts(dim):
+    """
+    For every wall placement, the masks of wall cells touching its two end
+    points and its middle point (None for an end on the board edge).
+    """
+    contacts = _WALL_CONTACTS.get(dim)
+    if contacts is None:
+        def point_mask(py, px):
+            if not (0 <= py < dim and 0 <= px < dim):
+                return None
+            mask = 0
+            for ny, nx in ((py, px), (py - 1, px), (py + 1, px), (py, px - 1), (py, px + 1)):
+                if 0 <= ny < dim and 0 <= nx < dim:
+                    mask |= 1 << (ny * dim + nx)
+            return mask
+        
+        contacts = {}
+        for y in range(1, dim - 1, 2):
+            for x in range(1, dim - 1, 2):
+                horizontal = ((y, x - 1), (y, x), (y, x + 1))
+                contacts[horizontal] = (point_mask(y, x - 2), point_mask(y, x), point_mask(y, x + 2))
+                vertical = ((y - 1, x), (y, x), (y + 1, x))
+                contacts[vertical] = (point_mask(y - 2, x), point_mask(y, x), point_mask(y + 2, x))
+        _WALL_CONTACTS[dim] = contacts
+    return contacts
+
+
+def _wall_valid_fast(virtual_board, cells, dim, p1_goal, p2_goal):
+    """
+    Check if wall placement leaves valid paths for both players.
     
-    # Check paths
-    p1_ok = _has_path_fast(grid, virtual_board[0][0], p1_goal, dim)
-    p2_ok = p1_ok and _has_path_fast(grid, virtual_board[1][0], p2_goal, dim)
+    A wall can only cut the board in two if it closes a loop, which needs
+    at least two of its end and middle points to already touch another
+    wall or the board edge. Walls touching at most one point keep every
+    existing path, so the flood fills are skipped for them.
+    """
+    wall_bits = virtual_board[4]
     
-    # Remove wall
-    for cy, cx in cells:
-        grid[cy][cx] = 0
+    touching = 0
+    for mask in _wall_contacts(dim)[cells]:
+        if mask is None or wall_bits & mask:
+            touching += 1
+    if touching < 2:
+        return True
     
-    return p1_ok and p2_ok
+    # Simulate the wall on a copy of the bitboard - nothing to undo
+    wall_bits |= _wall_mask(cells, dim)
+    
+    return _reachable(wall_bits, virtual_board[0][0], p1_goal,
+                      virtual_board[1][0], p2_goal, dim)
+
+
+def _reachable(wall_bits, p1_start, p1_goal, p2_start, p2_goal, dim):
+    """_paths_open_bits memoized on (walls, both pawn cells) for the current search."""
+    key = (wall_bits, p1_start[0] * dim + p1_start[1], p2_start[0] * dim + p2_start[1])
+    reachable = _REACHABLE_CACHE.get(key)
+    if reachable is None:
+        reachable = _paths_open_bits(wall_bits, p1_start, p1_goal, p2_start, p2_goal, dim)
+        _REACHABLE_CACHE[key] = reachable
+    return reachable
 
 
 # =============================================================================
@@ -387,9 +789,14 @@ def _wall_valid_fast(virtual_board, cells, dim, p1_goal, p2_goal):
 def _heuristic(board, virtual_board, wall_bonus_weight):
     """Evaluate board position."""
     dim = board.dimBoard
+    p1_goal = board.p1.objective
+    p2_goal = board.p2.objective
+    (p1_y, p1_x), _ = virtual_board[0]
+    (ai_y, ai_x), ai_walls = virtual_board[1]
     
-    p1_path = _astar_path(virtual_board, virtual_board[0][0], board.p1.objective, dim)
-    p2_path = _astar_path(virtual_board, virtual_board[1][0], board.p2.objective, dim)
+    # Look both players up in their goal-row distance fields directly
+    p1_path = _distance_field(virtual_board, p1_goal, dim)[p1_y * dim + p1_x]
+    p2_path = _distance_field(virtual_board, p2_goal, dim)[ai_y * dim + ai_x]
     
     if p1_path == 0:
         return -math.inf
@@ -400,72 +807,297 @@ def _heuristic(board, virtual_board, wall_bonus_weight):
     path_diff = (p1_path - p2_path) * 4
     
     # Wall bonus
-    wall_bonus = virtual_board[1][1] * wall_bonus_weight
+    wall_bonus = ai_walls * wall_bonus_weight
     
-    # Progress bonus for AI
-    ai_row = int(virtual_board[1][0][0])
-    ai_objective = board.p2.objective
+    # Progress bonus for AI: rows covered from its start row (16 - objective),
+    # without branching on which way it is heading
+    progress_bonus = abs(ai_y - (16 - p2_goal)) / 16.0
     
-    if ai_objective == 16:
-        progress_bonus = ai_row / 16.0
-    else:
-        progress_bonus = (16 - ai_row) / 16.0
+    # Oscillation penalty for lines that bring the AI back to recent cells
+    repeat_penalty = _REPEAT_PENALTIES.get((ai_y, ai_x), 0) if _REPEAT_PENALTIES else 0
     
-    return path_diff + wall_bonus + progress_bonus
+    return path_diff + wall_bonus + progress_bonus - repeat_penalty
+
+
+# =============================================================================
+# MOVE ORDERING
+# =============================================================================
+
+def _order_moves(board, virtual_board, moves, maximizing, first_move=None, killers=()):
+    """
+    Sort moves so the most promising are searched first.
+    
+    Pawn moves come first, shortest resulting path to goal first (a winning
+    step has length 0). Walls follow, with walls touching the opponent's
+    pawn ahead of the rest; otherwise the strategic order from
+    _get_wall_moves_smart is kept. `first_move` (e.g. a transposition
+    table hint) is moved to the front when present, followed by the
+    `killers` of this depth. Ties are broken by the history score.
+    """
+    dim = board.dimBoard
+    player_idx = 1 if maximizing else 0
+    target_row = board.p2.objective if maximizing else board.p1.objective
+    opp_y, opp_x = virtual_board[1 - player_idx][0]
+    history = _HISTORY_SCORES[player_idx]
+    distances = _distance_field(virtual_board, target_row, dim)
+    
+    # Partition in one pass; only the groups that need it get sorted, and the
+    # wall groups keep the generator's order unless history reorders them
+    first = []
+    killer_moves = []
+    pawns = []
+    near_walls = []
+    far_walls = []
+    for move in moves:
+        if move == first_move:
+            first.append(move)
+        elif move in killers:
+            killer_moves.append(move)
+        elif move[0] == PAWN_MOVE_CODE:
+            pawns.append(move)
+        else:
+            wall_y, wall_x = move[1][1]
+            if abs(wall_y - opp_y) + abs(wall_x - opp_x) <= 2:
+                near_walls.append(move)
+            else:
+                far_walls.append(move)
+    
+    if len(killer_moves) > 1:
+        killer_moves.sort(key=killers.index)
+    pawns.sort(key=lambda m: (distances[m[1][0] * dim + m[1][1]], -history.get(m, 0)))
+    if history:
+        near_walls.sort(key=lambda m: -history.get(m, 0))
+        far_walls.sort(key=lambda m: -history.get(m, 0))
+    
+    moves[:] = first + killer_moves + pawns + near_walls + far_walls
+    return moves
 
 
 # =============================================================================
 # ALPHA-BETA SEARCH
 # =============================================================================
 
-def _alpha_beta(board, virtual_board, depth, alpha, beta, maximizing, wall_bonus_weight):
-    """Alpha-Beta pruning minimax search."""
-    # Terminal checks - ALWAYS from AI (P2) perspective
-    if virtual_board[0][0][0] == board.p1.objective:
-        return -math.inf  # P1 wins = bad for AI
+def _alpha_beta(board, virtual_board, depth, alpha, beta, maximizing, wall_bonus_weight,
+                allow_null=True, walls_searched=True):
+    """
+    Alpha-Beta pruning minimax search.
     
-    if virtual_board[1][0][0] == board.p2.objective:
+    `walls_searched` tells whether the move leading here was chosen among
+    wall placements too, which the leaf needs before it may claim a win.
+    """
+    # Terminal checks - ALWAYS from AI (P2) perspective. Only the player who
+    # just moved can have reached their goal, so check that side alone.
+    if maximizing:
+        if virtual_board[0][0][0] == board.p1.objective:
+            return -math.inf  # P1 wins = bad for AI
+    elif virtual_board[1][0][0] == board.p2.objective:
         return math.inf   # P2 wins = good for AI
     
     # Depth limit
     if depth == 0:
-        return _heuristic(board, virtual_board, wall_bonus_weight)
+        return _quiescence(board, virtual_board, alpha, beta, maximizing,
+                           wall_bonus_weight, QUIESCENCE_DEPTH, walls_searched)
+    
+    # Transposition table probe
+    key = virtual_board[3]
+    entry = _TRANSPOSITION_TABLE.get(key)
+    tt_move = None
+    if entry is not None:
+        entry_depth, flag, value, tt_move = entry
+        if entry_depth >= depth:
+            if flag == TT_EXACT:
+                return value
+            if flag == TT_LOWER:
+                alpha = max(alpha, value)
+            else:
+                beta = min(beta, value)
+            if alpha >= beta:
+                return value
+    alpha_orig, beta_orig = alpha, beta
+    
+    dim = board.dimBoard
+    p1_goal = board.p1.objective
+    p2_goal = board.p2.objective
     
-    valid_moves = _get_valid_moves_virtual(board, virtual_board, maximizing)
+    # Null move: let the side to move pass and search shallower. If the
+    # position still fails outside the window, a real move would as well.
+    if (allow_null and depth >= NULL_MOVE_MIN_DEPTH and
+            not math.isinf(beta if maximizing else alpha) and
+            not _near_goal(virtual_board, dim, p1_goal, p2_goal)):
+        side_key = _zobrist_keys(dim)[3]
+        null_depth = max(0, depth - 1 - NULL_MOVE_REDUCTION)
+        virtual_board[3] ^= side_key
+        if maximizing:
+            null_value = _alpha_beta(board, virtual_board, null_depth,
+                                     beta - 1, beta, False, wall_bonus_weight, False)
+        else:
+            null_value = _alpha_beta(board, virtual_board, null_depth,
+                                     alpha, alpha + 1, True, wall_bonus_weight, False)
+        virtual_board[3] ^= side_key
+        if maximizing and null_value >= beta:
+            return beta
+        if not maximizing and null_value <= alpha:
+            return alpha
+    
+    # Frontier nodes only look at pawn moves, like a quiescence search,
+    # unless the opponent is one step from its goal and a wall is the only
+    # answer. Walls are path-checked lazily below, so cutoffs skip the rest.
+    moves_mode = 'all'
+    if depth == 1:
+        opp_idx, opp_goal = (0, p1_goal) if maximizing else (1, p2_goal)
+        opp_y, opp_x = virtual_board[opp_idx][0]
+        if (abs(opp_y - opp_goal) != 2 or
+                _distance_field(virtual_board, opp_goal, dim)[opp_y * dim + opp_x] != 1):
+            moves_mode = 'pawn'
+    valid_moves = _get_valid_moves_virtual(board, virtual_board, maximizing, moves_mode,
+                                           validate_walls=False)
     
     if not valid_moves:
         return _heuristic(board, virtual_board, wall_bonus_weight)
     
-    # Move ordering: winning moves first, then pawn moves, then walls
-    target_row = board.p2.objective if maximizing else board.p1.objective
-    valid_moves.sort(key=lambda m: (
-        -100 if m[0] == PAWN_MOVE_CODE and m[1][0] == target_row else
-        0 if m[0] == PAWN_MOVE_CODE else
-        10
-    ))
+    # Move ordering: TT move, killers, then pawn moves by path length, then walls
+    killers = _KILLER_MOVES.get(depth, ())
+    _order_moves(board, virtual_board, valid_moves, maximizing, tt_move, killers)
     
+    best_move = None
     if maximizing:
         max_eval = -math.inf
         for move in valid_moves:
-            new_board = _apply_move_virtual(board, virtual_board, move, True)
-            eval_score = _alpha_beta(board, new_board, depth - 1, alpha, beta, False, wall_bonus_weight)
-            max_eval = max(max_eval, eval_score)
+            if move[0] == WALL_MOVE_CODE and not _wall_valid_fast(virtual_board, move[1], dim, p1_goal, p2_goal):
+                continue
+            undo = _make_move_virtual(board, virtual_board, move, True)
+            eval_score = _alpha_beta(board, virtual_board, depth - 1, alpha, beta, False,
+                                     wall_bonus_weight, walls_searched=moves_mode == 'all')
+            _unmake_move_virtual(virtual_board, undo)
+            if eval_score > max_eval or best_move is None:
+                max_eval = eval_score
+                best_move = move
             alpha = max(alpha, eval_score)
             if beta <= alpha:
+                _record_cutoff(move, depth, True, p2_goal)
                 break
+        if best_move is None:
+            return _heuristic(board, virtual_board, wall_bonus_weight)
+        _store_tt_entry(key, depth, max_eval, alpha_orig, beta_orig, best_move)
         return max_eval
     else:
         min_eval = math.inf
         for move in valid_moves:
-            new_board = _apply_move_virtual(board, virtual_board, move, False)
-            eval_score = _alpha_beta(board, new_board, depth - 1, alpha, beta, True, wall_bonus_weight)
-            min_eval = min(min_eval, eval_score)
+            if move[0] == WALL_MOVE_CODE and not _wall_valid_fast(virtual_board, move[1], dim, p1_goal, p2_goal):
+                continue
+            undo = _make_move_virtual(board, virtual_board, move, False)
+            eval_score = _alpha_beta(board, virtual_board, depth - 1, alpha, beta, True,
+                                     wall_bonus_weight, walls_searched=moves_mode == 'all')
+            _unmake_move_virtual(virtual_board, undo)
+            if eval_score < min_eval or best_move is None:
+                min_eval = eval_score
+                best_move = move
             beta = min(beta, eval_score)
             if beta <= alpha:
+                _record_cutoff(move, depth, False, p1_goal)
                 break
+        if best_move is None:
+            return _heuristic(board, virtual_board, wall_bonus_weight)
+        _store_tt_entry(key, depth, min_eval, alpha_orig, beta_orig, best_move)
         return min_eval
 
 
+def _quiescence(board, virtual_board, alpha, beta, maximizing, wall_bonus_weight, qdepth,
+                walls_searched=True):
+    """
+    Leaf evaluation that settles pawn races decided just past the horizon.
+    
+    A side to move one step from its goal wins, provided the opponent's
+    last move was picked with walls considered (or it has none left) and
+    so could not have been a wall that stops it. A side without walls can
+    only move its pawn, so when the opponent is one step from its goal
+    those pawn moves are searched out instead of trusting the static score.
+    """
+    score = _heuristic(board, virtual_board, wall_bonus_weight)
+    if qdepth == 0 or math.isinf(score):
+        return score
+    
+    dim = board.dimBoard
+    mover_idx, opp_idx = (1, 0) if maximizing else (0, 1)
+    mover_goal, opp_goal = ((board.p2.objective, board.p1.objective) if maximizing
+                            else (board.p1.objective, board.p2.objective))
+    (mover_y, mover_x), mover_walls = virtual_board[mover_idx]
+    (opp_y, opp_x), opp_walls = virtual_board[opp_idx]
+    
+    # A win only counts if the opponent's last move could have been a wall
+    can_win = walls_searched or opp_walls == 0
+    
+    # One step from the goal means standing on the next row and not being
+    # walled off from it; the row test alone settles most leaves
+    mover_near = (can_win and abs(mover_y - mover_goal) == 2 and
+                  _distance_field(virtual_board, mover_goal, dim)[mover_y * dim + mover_x] == 1)
+    opp_near = (mover_walls == 0 and abs(opp_y - opp_goal) == 2 and
+                _distance_field(virtual_board, opp_goal, dim)[opp_y * dim + opp_x] == 1)
+    if not (mover_near or opp_near):
+        return score
+    
+    pawn_moves = _get_valid_moves_virtual(board, virtual_board, maximizing, 'pawn')
+    win = math.inf if maximizing else -math.inf
+    if can_win:
+        for move in pawn_moves:
+            if move[1][0] == mover_goal:
+                return win
+    if not opp_near or not pawn_moves:
+        return score
+    
+    # No walls left, so the pawn moves are every legal reply
+    best = -win
+    for move in pawn_moves:
+        undo = _make_move_virtual(board, virtual_board, move, maximizing)
+        value = _quiescence(board, virtual_board, alpha, beta, not maximizing,
+                            wall_bonus_weight, qdepth - 1, False)
+        _unmake_move_virtual(virtual_board, undo)
+        if maximizing:
+            best = max(best, value)
+            alpha = max(alpha, value)
+        else:
+            best = min(best, value)
+            beta = min(beta, value)
+        if alpha >= beta:
+            break
+    
+    return best
+
+
+def _near_goal(virtual_board, dim, p1_goal, p2_goal):
+    """True when either pawn can reach its goal row in a single step."""
+    (p1_y, p1_x), _ = virtual_board[0]
+    (ai_y, ai_x), _ = virtual_board[1]
+    return (_distance_field(virtual_board, p1_goal, dim)[p1_y * dim + p1_x] <= 1 or
+            _distance_field(virtual_board, p2_goal, dim)[ai_y * dim + ai_x] <= 1)
+
+
+def _record_cutoff(move, depth, maximizing, goal_row):
+    """Remember a move that caused a beta cutoff as a killer and in the history table."""
+    # A step onto the goal row cuts off on its own and is already ordered
+    # first by path length, so it would only waste a killer slot
+    if move[0] != PAWN_MOVE_CODE or move[1][0] != goal_row:
+        killers = _KILLER_MOVES.get(depth)
+        if killers is None:
+            _KILLER_MOVES[depth] = [move]
+        elif killers[0] != move:
+            _KILLER_MOVES[depth] = [move, killers[0]]
+    
+    history = _HISTORY_SCORES[1 if maximizing else 0]
+    history[move] = history.get(move, 0) + depth * depth
+
+
+def _store_tt_entry(key, depth, value, alpha, beta, best_move):
+    """Record a search result with its bound type relative to the (alpha, beta) window."""
+    if value <= alpha:
+        flag = TT_UPPER
+    elif value >= beta:
+        flag = TT_LOWER
+    else:
+        flag = TT_EXACT
+    _TRANSPOSITION_TABLE[key] = (depth, flag, value, best_move)
+
+
 # =============================================================================
 # OSCILLATION DETECTION
 # =============================================================================
@@ -488,6 +1120,19 @@ def find_best_move(board, ai_player, search_depth, wall_bonus_weight=1.0, positi
     if position_history is None:
         position_history = []
     
+    # Entries depend on the evaluation settings, so never reuse them across turns
+    _TRANSPOSITION_TABLE.clear()
+    _KILLER_MOVES.clear()
+    _DISTANCE_FIELDS.clear()
+    _REPEAT_PENALTIES.clear()
+    _FREE_WALL_SLOTS.clear()
+    _NEIGHBOR_CACHE.clear()
+    _REACHABLE_CACHE.clear()
+    _WALL_PRIORITIES.clear()
+    _PATH_WALL_CENTERS.clear()
+    for history in _HISTORY_SCORES:
+        history.clear()
+    
     virtual_board = _create_virtual_board(board)
     valid_moves = _get_valid_moves_virtual(board, virtual_board, maximizing=True)
     
@@ -499,51 +1144,74 @@ def find_best_move(board, ai_player, search_depth, wall_bonus_weight=1.0, positi
         if move[0] == PAWN_MOVE_CODE and move[1][0] == ai_player.objective:
             return move
     
-    # Sort: pawn moves first
-    valid_moves.sort(key=lambda m: (0 if m[0] == PAWN_MOVE_CODE else 1))
-    
-    # Detect oscillation
+    # Detect oscillation; revisiting a recent cell costs more each time
     is_stuck = _detect_oscillation(position_history)
+    for pos, visit_count in Counter(position_history).items():
+        _REPEAT_PENALTIES[pos] = visit_count * (visit_count + 1) / 2
     
-
+    # Iterative deepening: each pass orders the root by the previous best
+    # move and searches inside an aspiration window around its score.
+    best_move = None
+    best_value = None
     
+    for depth in range(1, search_depth + 1):
+        _order_moves(board, virtual_board, valid_moves, True, best_move)
+        
+        if best_value is None or math.isinf(best_value):
+            alpha, beta = -math.inf, math.inf
+        else:
+            alpha, beta = best_value - ASPIRATION_WINDOW, best_value + ASPIRATION_WINDOW
+        
+        value, move = _search_root(board, virtual_board, valid_moves, depth, alpha, beta,
+                                   wall_bonus_weight, is_stuck)
+        
+        # Fell outside the window - the bound is not a real score, search again
+        if value <= alpha or value >= beta:
+            value, move = _search_root(board, virtual_board, valid_moves, depth,
+                                       -math.inf, math.inf,
+                                       wall_bonus_weight, is_stuck)
+        
+        best_value, best_move = value, move
+    
+    return best_move
+
+
+def _search_root(board, virtual_board, valid_moves, depth, alpha, beta,
+                 wall_bonus_weight, is_stuck):
+    """Search every root move to `depth` plies, returning (best_value, best_move)."""
     best_move = None
     best_value = -math.inf
     
     for move in valid_moves:
-        new_virtual_board = _apply_move_virtual(board, virtual_board, move, True)
+        bonus = _root_move_bonus(move, is_stuck)
+        undo = _make_move_virtual(board, virtual_board, move, True)
         
+        # Shift the window by the bonus so the adjusted value is bounded correctly
         value = _alpha_beta(
             board,
-            new_virtual_board,
-            search_depth - 1,
-            -math.inf,
-            math.inf,
+            virtual_board,
+            depth - 1,
+            alpha - bonus,
+            beta - bonus,
             False,
             wall_bonus_weight
-        )
-        
-        # Oscillation penalty for pawn moves (escalating)
-        if move[0] == PAWN_MOVE_CODE and position_history:
-            move_pos = (int(move[1][0]), int(move[1][1]))
-            visit_count = position_history.count(move_pos)
-            if visit_count > 0:
-                penalty = visit_count * (visit_count + 1) / 2
-                value -= penalty
-        
-        # Wall bonus when stuck
-        if move[0] == WALL_MOVE_CODE and is_stuck:
-            value += 2.0
-        
-
+        ) + bonus
+        _unmake_move_virtual(virtual_board, undo)
         
         if value > best_value or best_move is None:
             best_value = value
             best_move = move
         
-        if value == math.inf:
+        alpha = max(alpha, value)
+        if value == math.inf or alpha >= beta:
             break
     
+    return best_value, best_move
 
-    
-    return best_move
\ No newline at end of file
+
+def _root_move_bonus(move, is_stuck):
+    """Score adjustment applied to a root move outside the search."""
+    # Wall bonus when stuck; repeated pawn cells are penalized in _heuristic
+    if move[0] == WALL_MOVE_CODE and is_stuck:
+        return 2.0
+    return 0
@@ -1,6 +1,6 @@
 from PySide6.QtWidgets import QWidget
-from PySide6.QtGui import QPainter, QPen, QColor, QBrush, QPainterPath
-from PySide6.QtCore import Qt, QTimer, QPointF
+from PySide6.QtGui import QPainter, QPen, QColor, QBrush, QPainterPath, QPixmap, QRegion
+from PySide6.QtCore import Qt, QPointF, QRect, QVariantAnimation
 from GUI.utils.signals import BoardSignals
 from GUI.utils.constants import BOARD_SIZE, CELL_COLOR, PAWN_COLORS
 from GUI.widgets.message_box import show_winner
@@ -30,12 +30,32 @@ class BoardWidget(QWidget):
         # Animation state
         self.click_animation_cell = None  # (row, col) for click animation
         self.animation_progress = 0.0  # 0.0 to 1.0
-        self.animation_timer = QTimer()
-        self.animation_timer.timeout.connect(self._update_animation)
+        self.click_animation = QVariantAnimation(self)
+        self.click_animation.setDuration(160)  # ms, driven by Qt's animation timer
+        self.click_animation.setStartValue(0.0)
+        self.click_animation.setEndValue(1.0)
+        self.click_animation.valueChanged.connect(self._update_animation)
+        self.click_animation.finished.connect(self._finish_animation)
 
         self.setMouseTracking(True)
         self.setFixedSize(540, 540)  # 9x9 board with 60px cells
 
+        # Static drawing tools, built once instead of on every paint
+        self._grid_pen = QPen(QColor(*CELL_COLOR), 2)
+        self._hover_color = QColor(255, 255, 150, 50)
+        self._valid_pen = QPen(QColor(50, 205, 50), 3)
+        self._valid_brush = QBrush(QColor(144, 238, 144, 100))
+        self._wall_pen = QPen(QColor(139, 69, 19), 8)
+        self._wall_preview_pen = QPen(QColor(139, 69, 19, 120), 8)
+        self._shadow_brush = QBrush(QColor(0, 0, 0, 60))
+        self._pawn_brushes = {name: QBrush(QColor(*color)) for name, color in PAWN_COLORS.items()}
+        self._selected_pen = QPen(QColor(255, 215, 0), 3)  # Gold border
+        self._pawn_pen = QPen(QColor(255, 255, 255), 2)  # White border
+
+        # Geometry cache, rebuilt in resizeEvent
+        self._cell = min(self.width(), self.height()) / BOARD_SIZE
+        self._grid_pixmap = None  # Static grid rendered once per size
+
     # ============ PUBLIC INTERFACE (Backend calls these) ============
 
     def update_pawns(self, pawns):
@@ -72,12 +92,10 @@ class BoardWidget(QWidget):
         painter = QPainter(self)
         painter.setRenderHint(QPainter.Antialiasing)
 
-        w = self.width()
-        h = self.height()
-        cell = min(w, h) / BOARD_SIZE
+        cell = self._cell
 
-        # Draw grid
-        self._draw_grid(painter, cell)
+        # Draw grid from the cached background
+        painter.drawPixmap(0, 0, self._grid_background())
 
         # Draw hover effect
         if self.hover_cell:
@@ -105,34 +123,36 @@ class BoardWidget(QWidget):
         """Handle mouse movement for hover effects and wall preview."""
         x = event.position().x()
         y = event.position().y()
-
-        w = self.width()
-        h = self.height()
-        cell = min(w, h) / BOARD_SIZE
+        cell = self._cell
 
         # Update hover cell
         col = int(x / cell)
         row = int(y / cell)
 
         if 0 <= row < BOARD_SIZE and 0 <= col < BOARD_SIZE:
-            self.hover_cell = (row, col)
+            hover_cell = (row, col)
         else:
-            self.hover_cell = None
+            hover_cell = None
 
         # Calculate wall preview position
-        self.preview_wall = self._calculate_wall_position(x, y, cell)
+        preview_wall = self._calculate_wall_position(x, y, cell)
 
-        self.update()
+        # Most mouse moves stay within the same cell and edge zone
+        if hover_cell == self.hover_cell and preview_wall == self.preview_wall:
+            return
+
+        # Repaint only what the old and new highlights cover
+        dirty = self._hover_region()
+        self.hover_cell = hover_cell
+        self.preview_wall = preview_wall
+        self.update(dirty.united(self._hover_region()))
 
     def mousePressEvent(self, event):
         """Handle mouse clicks."""
         if event.button() == Qt.LeftButton:
             x = event.position().x()
             y = event.position().y()
-
-            w = self.width()
-            h = self.height()
-            cell = min(w, h) / BOARD_SIZE
+            cell = self._cell
 
             col = int(x / cell)
             row = int(y / cell)
@@ -149,29 +169,77 @@ class BoardWidget(QWidget):
                 self.signals.cellClicked.emit(x, y)
                 self.signals.pawnClicked.emit(row, col)
 
-                # Start click animation
+                # Start click animation, clearing any ring still running
+                self.click_animation.stop()
+                if self.click_animation_cell:
+                    self.update(self._animation_rect())
                 self.click_animation_cell = (row, col)
                 self.animation_progress = 0.0
-                self.animation_timer.start(16)  # ~60 FPS
+                self.click_animation.start()
+
+    def resizeEvent(self, event):
+        """Recompute cell size and drop the cached grid for the new size."""
+        self._cell = min(self.width(), self.height()) / BOARD_SIZE
+        self._grid_pixmap = None
+        super().resizeEvent(event)
 
     def leaveEvent(self, event):
         """Clear hover effects when mouse leaves widget."""
+        dirty = self._hover_region()
         self.hover_cell = None
         self.preview_wall = None
-        self.update()
+        self.update(dirty)
 
     # ============ DRAWING HELPERS ============
 
+    def _cell_rect(self, row, col):
+        """Pixel rectangle covering a board cell."""
+        cell = self._cell
+        return QRect(int(col * cell), int(row * cell), int(cell) + 1, int(cell) + 1)
+
+    def _wall_rect(self, r, c, orientation):
+        """Pixel rectangle covering a wall line, including its pen width."""
+        cell = self._cell
+        if orientation == 'h':
+            rect = QRect(int(c * cell), int((r + 1) * cell), int(2 * cell), 0)
+        else:
+            rect = QRect(int((c + 1) * cell), int(r * cell), 0, int(2 * cell))
+        return rect.adjusted(-5, -5, 5, 5)
+
+    def _hover_region(self):
+        """Region covered by the current hover highlight and wall preview."""
+        region = QRegion()
+        if self.hover_cell:
+            region = region.united(self._cell_rect(*self.hover_cell))
+        if self.preview_wall:
+            region = region.united(self._wall_rect(*self.preview_wall))
+        return region
+
+    def _grid_background(self):
+        """Return the grid as a transparent pixmap, rendering it on first use."""
+        if self._grid_pixmap is None:
+            ratio = self.devicePixelRatioF()
+            pixmap = QPixmap(self.size() * ratio)
+            pixmap.setDevicePixelRatio(ratio)
+            pixmap.fill(Qt.transparent)
+
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.Antialiasing)
+            self._draw_grid(painter, self._cell)
+            painter.end()
+
+            self._grid_pixmap = pixmap
+        return self._grid_pixmap
+
     def _draw_grid(self, painter, cell):
         """Draw the 9x9 grid."""
-        pen = QPen(QColor(*CELL_COLOR), 2)
-        painter.setPen(pen)
+        painter.setPen(self._grid_pen)
 
-        for r in range(BOARD_SIZE):
-            for c in range(BOARD_SIZE):
-                x = c * cell
-                y = r * cell
-                painter.drawRect(int(x), int(y), int(cell), int(cell))
+        # One batched call for all squares instead of one call per square
+        size = int(cell)
+        painter.drawRects([QRect(int(c * cell), int(r * cell), size, size)
+                           for r in range(BOARD_SIZE)
+                           for c in range(BOARD_SIZE)])
 
     def _draw_hover_effect(self, painter, cell):
         """Draw subtle highlight on hovered cell."""
@@ -183,19 +251,19 @@ class BoardWidget(QWidget):
         y = row * cell
 
         # Semi-transparent yellow highlight
-        painter.fillRect(int(x), int(y), int(cell), int(cell),
-                        QColor(255, 255, 150, 50))
+        painter.fillRect(int(x), int(y), int(cell), int(cell), self._hover_color)
 
     def _draw_valid_moves(self, painter, cell):
         """Draw highlights for valid move positions."""
+        painter.setPen(self._valid_pen)
+        painter.setBrush(self._valid_brush)
+        radius = cell * 0.25
+
         for row, col in self.valid_moves:
             x = col * cell + cell / 2
             y = row * cell + cell / 2
-            radius = cell * 0.25
 
             # Draw pulsing circle
-            painter.setPen(QPen(QColor(50, 205, 50), 3))
-            painter.setBrush(QBrush(QColor(144, 238, 144, 100)))
             painter.drawEllipse(
                 QPointF(x, y),
                 radius,
@@ -204,8 +272,7 @@ class BoardWidget(QWidget):
 
     def _draw_walls(self, painter, cell):
         """Draw placed walls."""
-        wall_pen = QPen(QColor(139, 69, 19), 8)
-        painter.setPen(wall_pen)
+        painter.setPen(self._wall_pen)
 
         for r, c, orientation in self.walls:
             if orientation == 'h':  # Horizontal wall
@@ -227,8 +294,7 @@ class BoardWidget(QWidget):
         r, c, orientation = self.preview_wall
 
         # Semi-transparent brown
-        wall_pen = QPen(QColor(139, 69, 19, 120), 8)
-        painter.setPen(wall_pen)
+        painter.setPen(self._wall_preview_pen)
 
         if orientation == 'h':
             x_start = c * cell
@@ -251,7 +317,7 @@ class BoardWidget(QWidget):
             # Draw shadow
             shadow_offset = 3
             painter.setPen(Qt.NoPen)
-            painter.setBrush(QBrush(QColor(0, 0, 0, 60)))
+            painter.setBrush(self._shadow_brush)
             painter.drawEllipse(
                 int(x - radius + shadow_offset),
                 int(y - radius + shadow_offset),
@@ -260,13 +326,13 @@ class BoardWidget(QWidget):
             )
 
             # Draw pawn
-            painter.setBrush(QBrush(QColor(*PAWN_COLORS[name])))
+            painter.setBrush(self._pawn_brushes[name])
 
             # Add border if selected
             if self.selected_pawn == (r, c):
-                painter.setPen(QPen(QColor(255, 215, 0), 3))  # Gold border
+                painter.setPen(self._selected_pen)
             else:
-                painter.setPen(QPen(QColor(255, 255, 255), 2))  # White border
+                painter.setPen(self._pawn_pen)
 
             painter.drawEllipse(
                 int(x - radius),
@@ -317,64 +383,64 @@ class BoardWidget(QWidget):
         col_frac = col_float - col_int
         row_frac = row_float - row_int
 
-        # Calculate distance to each edge of the cell
-        dist_to_top = row_frac
-        dist_to_bottom = 1.0 - row_frac
-        dist_to_left = col_frac
-        dist_to_right = 1.0 - col_frac
+        # Distance to each edge of the cell: top, bottom, left, right
+        dists = (row_frac, 1.0 - row_frac, col_frac, 1.0 - col_frac)
 
-        # Find the closest edge
-        min_dist = min(dist_to_top, dist_to_bottom, dist_to_left, dist_to_right)
+        # Find the closest edge (ties keep this order)
+        edge = min(range(4), key=dists.__getitem__)
 
         # Only show preview if close enough to an edge
         threshold = 0.3  # 30% of cell size
-        if min_dist > threshold:
+        if dists[edge] > threshold:
             return None
 
-        # Determine orientation based on which edge is closest
-        if min_dist == dist_to_top or min_dist == dist_to_bottom:
-            # Closest to horizontal edge → horizontal wall
-            if min_dist == dist_to_top and row_int > 0:
-                # Top edge → wall above this cell
-                wall_row = row_int - 1
-                wall_col = col_int
-            elif min_dist == dist_to_bottom and row_int < BOARD_SIZE - 1:
-                # Bottom edge → wall below this cell
-                wall_row = row_int
-                wall_col = col_int
-            else:
+        # Top/bottom edges give horizontal walls, left/right give vertical ones
+        if edge == 0:
+            # Top edge → wall above this cell
+            if row_int == 0:
                 return None
-
-            # Check if wall can fit (needs 2 cells horizontally)
-            if wall_col < BOARD_SIZE - 1:
-                return (wall_row, wall_col, 'h')
-
+            wall_row, wall_col, orientation = row_int - 1, col_int, 'h'
+        elif edge == 1:
+            # Bottom edge → wall below this cell
+            if row_int == BOARD_SIZE - 1:
+                return None
+            wall_row, wall_col, orientation = row_int, col_int, 'h'
+        elif edge == 2:
+            # Left edge → wall to the left of this cell
+            if col_int == 0:
+                return None
+            wall_row, wall_col, orientation = row_int, col_int - 1, 'v'
         else:
-            # Closest to vertical edge → vertical wall
-            if min_dist == dist_to_left and col_int > 0:
-                # Left edge → wall to the left of this cell
-                wall_row = row_int
-                wall_col = col_int - 1
-            elif min_dist == dist_to_right and col_int < BOARD_SIZE - 1:
-                # Right edge → wall to the right of this cell
-                wall_row = row_int
-                wall_col = col_int
-            else:
+            # Right edge → wall to the right of this cell
+            if col_int == BOARD_SIZE - 1:
                 return None
+            wall_row, wall_col, orientation = row_int, col_int, 'v'
 
-            # Check if wall can fit (needs 2 cells vertically)
-            if wall_row < BOARD_SIZE - 1:
-                return (wall_row, wall_col, 'v')
+        # Check if wall can fit (needs 2 cells along its length)
+        span = wall_col if orientation == 'h' else wall_row
+        if span < BOARD_SIZE - 1:
+            return (wall_row, wall_col, orientation)
 
         return None
 
-    def _update_animation(self):
+    def _animation_rect(self):
+        """Pixel rectangle the click ring can cover; it never leaves its cell."""
+        return self._cell_rect(*self.click_animation_cell).adjusted(-2, -2, 2, 2)
+
+    def _update_animation(self, value):
         """Update click animation progress."""
-        self.animation_progress += 0.1
+        if not self.click_animation_cell:
+            return
 
-        if self.animation_progress >= 1.0:
-            self.animation_timer.stop()
-            self.click_animation_cell = None
-            self.animation_progress = 0.0
+        self.animation_progress = value
+        self.update(self._animation_rect())
 
-        self.update()
+    def _finish_animation(self):
+        """Clear the click ring once the animation has run."""
+        if not self.click_animation_cell:
+            return
+
+        dirty = self._animation_rect()
+        self.click_animation_cell = None
+        self.animation_progress = 0.0
+        self.update(dirty)
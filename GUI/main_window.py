@@ -3,6 +3,19 @@ from PySide6.QtGui import QIcon, QAction, QKeySequence
 from PySide6.QtCore import Qt, QSize
 
 
+# Toolbar icons, loaded from disk on first use and shared by later windows
+_ICON_CACHE = {}
+
+
+def _icon(name):
+    """Return the cached toolbar icon GUI/resources/icons/<name>.png."""
+    icon = _ICON_CACHE.get(name)
+    if icon is None:
+        icon = QIcon(f"GUI/resources/icons/{name}.png")
+        _ICON_CACHE[name] = icon
+    return icon
+
+
 class MainWindow(QMainWindow):
     def __init__(self, game_view):
         super().__init__()
@@ -85,10 +98,10 @@ class MainWindow(QMainWindow):
         toolbar.setIconSize(QSize(24, 24))
 
         # Game actions
-        new_game_action = QAction(QIcon("GUI/resources/icons/new.png"), "New Game", self)
+        new_game_action = QAction(_icon("new"), "New Game", self)
         new_game_action.triggered.connect(self.game_view.board.signals.newGameRequested.emit)
 
-        restart_action = QAction(QIcon("GUI/resources/icons/restart.png"), "Restart", self)
+        restart_action = QAction(_icon("restart"), "Restart", self)
         restart_action.triggered.connect(self.game_view.board.signals.restartRequested.emit)
 
         toolbar.addAction(new_game_action)
@@ -96,10 +109,10 @@ class MainWindow(QMainWindow):
         toolbar.addSeparator()
 
         # Edit actions
-        undo_action = QAction(QIcon("GUI/resources/icons/undo.png"), "Undo", self)
+        undo_action = QAction(_icon("undo"), "Undo", self)
         undo_action.triggered.connect(self.game_view.board.signals.undoRequested.emit)
 
-        redo_action = QAction(QIcon("GUI/resources/icons/redo.png"), "Redo", self)
+        redo_action = QAction(_icon("redo"), "Redo", self)
         redo_action.triggered.connect(self.game_view.board.signals.redoRequested.emit)
 
         toolbar.addAction(undo_action)
@@ -107,10 +120,10 @@ class MainWindow(QMainWindow):
         toolbar.addSeparator()
 
         # File actions
-        save_action = QAction(QIcon("GUI/resources/icons/save.png"), "Save", self)
+        save_action = QAction(_icon("save"), "Save", self)
         save_action.triggered.connect(self.game_view.board.signals.saveRequested.emit)
 
-        load_action = QAction(QIcon("GUI/resources/icons/load.png"), "Load", self)
+        load_action = QAction(_icon("load"), "Load", self)
         load_action.triggered.connect(self.game_view.board.signals.loadRequested.emit)
 
         toolbar.addAction(save_action)
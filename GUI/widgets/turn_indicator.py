@@ -3,12 +3,20 @@ from PySide6.QtGui import QColor
 
 
 class TurnIndicator(QLabel):
+    # Built once so a turn switch never formats a new stylesheet
+    _RED_STYLE = "font-size: 18px; font-weight: bold; color: #E63946;"
+    _BLUE_STYLE = "font-size: 18px; font-weight: bold; color: #467C9E;"
+
     def __init__(self):
         super().__init__("Turn: Red")
-        self.setStyleSheet("font-size: 18px; font-weight: bold; color: white;")
+        self._style = "font-size: 18px; font-weight: bold; color: white;"
+        self.setStyleSheet(self._style)
 
     def set_turn(self, player_name: str):
         """Update the turn indicator to show current player."""
-        color = "#E63946" if player_name == "Red" else "#467C9E"
+        style = self._RED_STYLE if player_name == "Red" else self._BLUE_STYLE
         self.setText(f"Turn: {player_name}")
-        self.setStyleSheet(f"font-size: 18px; font-weight: bold; color: {color};")
+        # Only re-style on an actual change; repeated calls just set text
+        if style != self._style:
+            self._style = style
+            self.setStyleSheet(style)
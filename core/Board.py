@@ -21,7 +21,7 @@ class Board:
         self.dimBoard = self.dimPawnBoard + self.dimWallBoard   # 17 × 17 grid
 
         # Actual game board (walls + players + empty tiles)
-        self.board = np.zeros((self.dimBoard, self.dimBoard), dtype=int)
+        self.board = np.zeros((self.dimBoard, self.dimBoard), dtype=np.int8)
 
         # Game mode
         self.vs_ai = vs_ai
@@ -91,7 +91,7 @@ class Board:
         ]
         """
         return [
-            [self.p1.pos.copy(), self.p1.available_walls],
-            [self.p2.pos.copy(), self.p2.available_walls],
+            [np.array(self.p1.pos), self.p1.available_walls],
+            [np.array(self.p2.pos), self.p2.available_walls],
             self.board.copy(),
         ]
@@ -1,22 +1,22 @@
 # core/movement.py
 
-import numpy as np
-from core.rules import DIRECTIONS, DIAGONALS
+from core.rules import DIR_VEC, JUMP_OFFSETS
 
 
 # ---------------------------------------------------------
 # BASIC MOVE HANDLER (up / down / left / right)
 # ---------------------------------------------------------
 def try_move_direction(player, direction):
-    dy, dx = DIRECTIONS[direction]
-    y, x = player.pos
+    dy, dx = DIR_VEC[direction]
+    y, x = player.y, player.x
     board = player.board.board
 
     ny, nx = y + dy, x + dx
     wall_y, wall_x = y + dy // 2, x + dx // 2
 
     # Out of bounds
-    if not (0 <= ny < player.board.dimBoard and 0 <= nx < player.board.dimBoard):
+    dim = player.board.dimBoard
+    if (ny | nx) < 0 or ny >= dim or nx >= dim:
         return False
 
     # Wall blocking movement
@@ -28,21 +28,22 @@ def try_move_direction(player, direction):
         return _apply_move(player, ny, nx)
 
     # Opponent in front → try jumping
-    return _attempt_jump_over_opponent(player, dy, dx)
+    return _attempt_jump_over_opponent(player, direction)
 
 
 # ---------------------------------------------------------
 # DIAGONAL MOVE (player is blocked → side-step)
 # ---------------------------------------------------------
 def try_jump_diagonal(player, direction):
-    dy, dx = DIAGONALS[direction]
-    y, x = player.pos
+    dy, dx = DIR_VEC[direction]
+    y, x = player.y, player.x
     board = player.board.board
 
     ny, nx = y + dy, x + dx
 
     # bounds
-    if not (0 <= ny < player.board.dimBoard and 0 <= nx < player.board.dimBoard):
+    dim = player.board.dimBoard
+    if (ny | nx) < 0 or ny >= dim or nx >= dim:
         return False
 
     # Requirements:
@@ -67,7 +68,7 @@ def try_jump_diagonal(player, direction):
 # ---------------------------------------------------------
 # INTERNAL UTILITIES
 # ---------------------------------------------------------
-def _attempt_jump_over_opponent(player, dy, dx):
+def _attempt_jump_over_opponent(player, direction):
     """
     Handle 'jump forward' logic:
         P
@@ -76,31 +77,25 @@ def _attempt_jump_over_opponent(player, dy, dx):
         |
       empty? → jump
     """
-    y, x = player.pos
+    _, _, wdy, wdx, w2dy, w2dx, jdy, jdx = JUMP_OFFSETS[direction]
+    y, x = player.y, player.x
     board = player.board.board
 
-    # Opponent tile
-    mid_y = y + dy
-    mid_x = x + dx
-
     # Target jump tile
-    jump_y = y + dy * 2
-    jump_x = x + dx * 2
+    jump_y = y + jdy
+    jump_x = x + jdx
 
     # Bounds
-    if not (0 <= jump_y < player.board.dimBoard and 0 <= jump_x < player.board.dimBoard):
+    dim = player.board.dimBoard
+    if (jump_y | jump_x) < 0 or jump_y >= dim or jump_x >= dim:
         return False
 
     # Forward wall check
-    wall_y = y + dy // 2
-    wall_x = x + dx // 2
-    if board[wall_y, wall_x] != 0:
+    if board[y + wdy, x + wdx] != 0:
         return False
 
     # Wall behind opponent
-    wall2_y = y + dy * 3 // 2
-    wall2_x = x + dx * 3 // 2
-    if board[wall2_y, wall2_x] != 0:
+    if board[y + w2dy, x + w2dx] != 0:
         return False
 
     # Jump tile must be empty
@@ -115,10 +110,11 @@ def _apply_move(player, ny, nx):
     board = player.board.board
 
     # Remove old position
-    board[player.pos[0], player.pos[1]] = 0
+    board[player.y, player.x] = 0
 
     # Apply new position
-    player.pos = np.array([ny, nx], dtype=int)
+    player.y = ny
+    player.x = nx
     board[ny, nx] = player.id
 
     return True
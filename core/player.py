@@ -1,12 +1,35 @@
 # core/player.py
 
-import numpy as np
 from core.movement import (
     try_move_direction,
     try_jump_diagonal,
     _apply_move,
 )
 from core.walls import is_wall_placement_valid
+from core.rules import (
+    DIR_TOP, DIR_DOWN, DIR_LEFT, DIR_RIGHT,
+    DIR_TOP_LEFT, DIR_TOP_RIGHT, DIR_DOWN_LEFT, DIR_DOWN_RIGHT,
+    DIR_VEC,
+    DIRECTION_CODES,
+)
+
+
+# (dy, dx) offset to a target cell -> direction code that reaches it;
+# straight jumps (distance 4) go through the plain step in that direction
+_TARGET_DIRECTIONS = {
+    (-2, 0): DIR_TOP,
+    (2, 0): DIR_DOWN,
+    (0, -2): DIR_LEFT,
+    (0, 2): DIR_RIGHT,
+    (-2, -2): DIR_TOP_LEFT,
+    (-2, 2): DIR_TOP_RIGHT,
+    (2, -2): DIR_DOWN_LEFT,
+    (2, 2): DIR_DOWN_RIGHT,
+    (-4, 0): DIR_TOP,
+    (4, 0): DIR_DOWN,
+    (0, -4): DIR_LEFT,
+    (0, 4): DIR_RIGHT,
+}
 
 
 class Player:
@@ -15,13 +38,19 @@ class Player:
     def __init__(self, id, board, pos, objective, available_walls=10):
         self.id = id
         self.board = board
-        self.pos = pos.astype(int)
+        # Plain int coordinates; pos is a read-only (y, x) view
+        self.y = int(pos[0])
+        self.x = int(pos[1])
         self.objective = objective
         self.available_walls = available_walls
         self.color = Player.colors[self.id - 1]
 
         # Place pawn in board grid
-        self.board.board[self.pos[0], self.pos[1]] = self.id
+        self.board.board[self.y, self.x] = self.id
+
+    @property
+    def pos(self):
+        return (self.y, self.x)
 
     # ---------------------------------------------------------
     # PUBLIC MOVE HANDLER (called by GUI)
@@ -32,8 +61,7 @@ class Player:
             top / down / left / right
             topLeft / topRight / downLeft / downRight
         """
-        success = self.move(direction)
-        return success
+        return self.move(direction)
 
     def move_to_position(self, target_y, target_x):
         """
@@ -44,7 +72,7 @@ class Player:
         # Determine direction from current position to target
         direction = self._get_direction_to(target_y, target_x)
         
-        if direction:
+        if direction is not None:
             return self.move(direction)
         
         # If no standard direction matches, try direct move for jumps
@@ -53,44 +81,10 @@ class Player:
 
     def _get_direction_to(self, target_y, target_x):
         """
-        Determine the direction string from current position to target.
-        Returns direction string or None if not a standard move.
+        Determine the direction code from current position to target.
+        Returns a DIR_* code or None if not a standard move.
         """
-        y, x = self.pos
-        dy = target_y - y
-        dx = target_x - x
-        
-        # Standard moves (distance of 2 in one direction)
-        if dy == -2 and dx == 0:
-            return "top"
-        elif dy == 2 and dx == 0:
-            return "down"
-        elif dy == 0 and dx == -2:
-            return "left"
-        elif dy == 0 and dx == 2:
-            return "right"
-        
-        # Diagonal moves (distance of 2 in both directions)
-        elif dy == -2 and dx == -2:
-            return "topLeft"
-        elif dy == -2 and dx == 2:
-            return "topRight"
-        elif dy == 2 and dx == -2:
-            return "downLeft"
-        elif dy == 2 and dx == 2:
-            return "downRight"
-        
-        # Jump moves (distance of 4 in one direction) - handled by direction
-        elif dy == -4 and dx == 0:
-            return "top"
-        elif dy == 4 and dx == 0:
-            return "down"
-        elif dy == 0 and dx == -4:
-            return "left"
-        elif dy == 0 and dx == 4:
-            return "right"
-        
-        return None
+        return _TARGET_DIRECTIONS.get((target_y - self.y, target_x - self.x))
 
     def _try_direct_move(self, target_y, target_x):
         """
@@ -111,14 +105,19 @@ class Player:
     def move(self, direction):
         """
         Delegates logic to movement module.
+
+        direction is a DIR_* code or one of the DIRECTION_CODES names;
+        anything else is rejected with False.
         """
 
+        if isinstance(direction, str):
+            direction = DIRECTION_CODES.get(direction)
+        if direction is None or not 0 <= direction < len(DIR_VEC):
+            return False
+
         # Standard 4-direction movement
-        if direction in ["top", "down", "left", "right"]:
+        if direction < DIR_TOP_LEFT:
             return try_move_direction(self, direction)
 
         # Diagonal movement (jump-side-step)
-        if direction in ["topLeft", "topRight", "downLeft", "downRight"]:
-            return try_jump_diagonal(self, direction)
-
-        return False
+        return try_jump_diagonal(self, direction)
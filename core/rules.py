@@ -25,25 +25,39 @@ WALL_MOVE_CODE = 1
 # PAWN MOVE DIRECTIONS
 # ---------------------------------------------------------
 
-DIRECTIONS = {
-    "top":    (-2, 0),
-    "down":   (+2, 0),
-    "left":   (0, -2),
-    "right":  (0, +2),
-}
-
-DIRECTIONS["bottom"] = DIRECTIONS["down"]
-
-
-# ---------------------------------------------------------
-# DIAGONAL JUMPS
-# ---------------------------------------------------------
-
-DIAGONALS = {
-    "topLeft":     (-2, -2),
-    "topRight":    (-2, +2),
-    "bottomLeft":  (+2, -2),
-    "bottomRight": (+2, +2),
+# Integer direction codes index DIR_VEC; codes below DIR_TOP_LEFT are
+# straight steps, the rest are diagonal side-steps
+DIR_TOP, DIR_DOWN, DIR_LEFT, DIR_RIGHT = 0, 1, 2, 3
+DIR_TOP_LEFT, DIR_TOP_RIGHT, DIR_DOWN_LEFT, DIR_DOWN_RIGHT = 4, 5, 6, 7
+DIR_UP = DIR_TOP
+
+DIR_VEC = (
+    (-2, 0), (+2, 0), (0, -2), (0, +2),
+    (-2, -2), (-2, +2), (+2, -2), (+2, +2),
+)
+
+# Straight-jump offsets per straight direction code:
+# (dy, dx, wall_dy, wall_dx, wall2_dy, wall2_dx, jump_dy, jump_dx)
+# where wall is in front of the pawn and wall2 is behind the opponent
+JUMP_OFFSETS = tuple(
+    (dy, dx, dy // 2, dx // 2, dy * 3 // 2, dx * 3 // 2, dy * 2, dx * 2)
+    for dy, dx in DIR_VEC[:DIR_TOP_LEFT]
+)
+
+# String names accepted from the GUI, converted once at the edge
+DIRECTION_CODES = {
+    "top":         DIR_TOP,
+    "up":          DIR_TOP,
+    "down":        DIR_DOWN,
+    "bottom":      DIR_DOWN,
+    "left":        DIR_LEFT,
+    "right":       DIR_RIGHT,
+    "topLeft":     DIR_TOP_LEFT,
+    "topRight":    DIR_TOP_RIGHT,
+    "downLeft":    DIR_DOWN_LEFT,
+    "bottomLeft":  DIR_DOWN_LEFT,
+    "downRight":   DIR_DOWN_RIGHT,
+    "bottomRight": DIR_DOWN_RIGHT,
 }
 
 
@@ -60,7 +74,8 @@ VERTICAL_CONNECTOR_CODE   = 2
 # ---------------------------------------------------------
 
 def is_inside(y, x, dim):
-    return 0 <= y < dim and 0 <= x < dim
+    # y | x is negative iff either coordinate is, so one test covers both
+    return (y | x) >= 0 and y < dim and x < dim
 
 
 def is_cell(y, x):
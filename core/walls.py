@@ -7,9 +7,6 @@ Handles Quoridor wall placement logic:
 - validates that paths remain available
 """
 
-import numpy as np
-from collections import deque
-
 from core.rules import (
     is_inside,
     is_wall_spot,
@@ -17,6 +14,9 @@ from core.rules import (
     VERTICAL_CONNECTOR_CODE,
 )
 
+# (y, x, orientation) -> (segments, connector); built on first use
+_WALL_CELLS = {}
+
 
 # =========================================================
 # PUBLIC API
@@ -60,7 +60,7 @@ def is_wall_placement_valid(board, y, x):
     segs, connector = _wall_cells(y, x, orientation)
 
     # Out of bounds check
-    for sy, sx in segs + [connector]:
+    for sy, sx in segs + (connector,):
         if not is_inside(sy, sx, dim):
             return False
 
@@ -117,10 +117,15 @@ def place_wall(board, y, x, player):
 
 def _wall_cells(y, x, orientation):
     """
-    Returns:
-        segments = [(y1, x1), (y2, x2)]
+    Returns (memoized, so callers must not mutate):
+        segments = ((y1, x1), (y2, x2))
         connector = (cy, cx)
     """
+    key = (y, x, orientation)
+    cells = _WALL_CELLS.get(key)
+    if cells is not None:
+        return cells
+
     if orientation == "H":
         seg1 = (y, x)
         seg2 = (y, x + 2)
@@ -130,81 +135,90 @@ def _wall_cells(y, x, orientation):
         seg2 = (y + 2, x)
         connector = (y + 1, x)
 
-    return [seg1, seg2], connector
+    cells = ((seg1, seg2), connector)
+    _WALL_CELLS[key] = cells
+    return cells
 
 
 def _check_paths_after_simulated_wall(board, segs, connector):
     """
     Simulate the wall, check BFS connectivity for both players.
-    """
 
-    grid = board.board
+    The wall is painted into a flat list copy of the grid, so the real board
+    is never touched and both searches index plain ints instead of numpy.
+    """
 
-    # Temporarily place wall
-    removed_values = []
-    for sy, sx in segs:
-        removed_values.append(grid[sy, sx])
-        grid[sy, sx] = 1
+    dim = board.dimBoard
+    cells = board.board.ravel().tolist()
 
-    removed_connector = grid[connector[0], connector[1]]
-    grid[connector[0], connector[1]] = 1
+    for sy, sx in segs + (connector,):
+        cells[sy * dim + sx] = 1
 
     # Check path exists for p1 and p2
-    ok = (
-        _player_has_path(board, board.p1) and
-        _player_has_path(board, board.p2)
+    p1, p2 = board.p1, board.p2
+    return (
+        _player_has_path(cells, dim, p1.y * dim + p1.x, p1.objective, p1.id) and
+        _player_has_path(cells, dim, p2.y * dim + p2.x, p2.objective, p2.id)
     )
 
-    # Undo the simulation
-    for (sy, sx), v in zip(segs, removed_values):
-        grid[sy, sx] = v
-
-    grid[connector[0], connector[1]] = removed_connector
 
-    return ok
-
-
-def _player_has_path(board, player):
+def _player_has_path(cells, dim, start, target_row, player_id):
     """
-    BFS from player's position until reaching objective row.
+    BFS from a flat start index until reaching target_row.
 
-    Pawns move through even-even tiles only.
+    Pawns move through even-even tiles only. cells is the grid flattened
+    row-major, so a cell and the wall slot next to it are both flat
+    indices; visited is a byte mask over the same indices.
     """
 
-    start = tuple(player.pos)
-    target_row = player.objective
-
-    dim = board.dimBoard
-    grid = board.board
+    passable = (0, player_id)
+    goal_lo = target_row * dim
+    goal_hi = goal_lo + dim
 
-    q = deque([start])
-    visited = {start}
+    queue = [0] * ((dim + 1) // 2) ** 2
+    queue[0] = start
+    visited = bytearray(dim * dim)
+    visited[start] = 1
+    head, tail = 0, 1
 
-    # Movement vectors: (±2,0), (0,±2)
-    moves = [(2, 0), (-2, 0), (0, 2), (0, -2)]
+    row_step = dim * 2
+    bottom = (dim - 2) * dim    # first index of the last pawn row
+    last = dim - 3
 
-    while q:
-        y, x = q.popleft()
+    while head < tail:
+        idx = queue[head]
+        head += 1
 
         # Reached goal row
-        if y == target_row:
+        if goal_lo <= idx < goal_hi:
             return True
 
-        for dy, dx in moves:
-            ny, nx = y + dy, x + dx
-
-            if not is_inside(ny, nx, dim):
-                continue
-
-            # Check wall between (y,x) and (ny,nx)
-            wall_y = y + dy // 2
-            wall_x = x + dx // 2
-            if grid[wall_y, wall_x] != 0:
-                continue
-
-            # Check cell occupancy
-            if (ny, nx) not in visited and grid[ny, nx] in (0, player.id):
-                visited.add((ny, nx))
-                q.append((ny, nx))
+        x = idx % dim
+
+        # Up / down / left / right: bounds, wall between, then occupancy
+        if idx >= row_step and cells[idx - dim] == 0:
+            n = idx - row_step
+            if not visited[n] and cells[n] in passable:
+                visited[n] = 1
+                queue[tail] = n
+                tail += 1
+        if idx < bottom and cells[idx + dim] == 0:
+            n = idx + row_step
+            if not visited[n] and cells[n] in passable:
+                visited[n] = 1
+                queue[tail] = n
+                tail += 1
+        if x >= 2 and cells[idx - 1] == 0:
+            n = idx - 2
+            if not visited[n] and cells[n] in passable:
+                visited[n] = 1
+                queue[tail] = n
+                tail += 1
+        if x <= last and cells[idx + 1] == 0:
+            n = idx + 2
+            if not visited[n] and cells[n] in passable:
+                visited[n] = 1
+                queue[tail] = n
+                tail += 1
 
     return False
@@ -603,15 +603,13 @@ class QuoridorGame:
 
             # Restore board state
             import numpy as np
-            self.game.board = np.array(game_state['board']['grid'])
+            self.game.board = np.array(game_state['board']['grid'], dtype=np.int8)
 
             # Restore player states
-            self.game.p1.pos[0] = game_state['players']['p1']['pos'][0]
-            self.game.p1.pos[1] = game_state['players']['p1']['pos'][1]
+            self.game.p1.y, self.game.p1.x = game_state['players']['p1']['pos']
             self.game.p1.available_walls = game_state['players']['p1']['walls']
 
-            self.game.p2.pos[0] = game_state['players']['p2']['pos'][0]
-            self.game.p2.pos[1] = game_state['players']['p2']['pos'][1]
+            self.game.p2.y, self.game.p2.x = game_state['players']['p2']['pos']
             self.game.p2.available_walls = game_state['players']['p2']['walls']
 
             # Restore current turn
@@ -0,0 +1,91 @@
+"""
+Tests for pawn movement through Player.move and its direction codes.
+"""
+
+import unittest
+
+from core.Board import Board
+from core.rules import DIR_UP, DIR_TOP, DIR_TOP_LEFT, DIR_DOWN_RIGHT, DIRECTION_CODES
+
+
+def _board_with_pawns(p1_pos, p2_pos):
+    board = Board()
+    for player in (board.p1, board.p2):
+        board.board[player.y, player.x] = 0
+    for player, (y, x) in ((board.p1, p1_pos), (board.p2, p2_pos)):
+        player.y, player.x = y, x
+        board.board[y, x] = player.id
+    return board
+
+
+def _place_horizontal_wall(board, y, x):
+    """Horizontal wall centered on connector (y, x)."""
+    board.board[y, x - 1] = 1
+    board.board[y, x] = 1
+    board.board[y, x + 1] = 1
+
+
+class DirectionCodeTest(unittest.TestCase):
+
+    def test_up_name_and_alias(self):
+        board = Board()
+        p1 = board.p1
+        self.assertEqual(p1.pos, (16, 8))
+        self.assertTrue(p1.move('up'))
+        self.assertEqual(p1.pos, (14, 8))
+        self.assertTrue(p1.move(DIR_UP))
+        self.assertEqual(p1.pos, (12, 8))
+        self.assertEqual(DIR_UP, DIR_TOP)
+        self.assertEqual(board.board[12, 8], p1.id)
+        self.assertEqual(board.board[16, 8], 0)
+
+    def test_every_name_maps_to_a_code(self):
+        for name, code in DIRECTION_CODES.items():
+            self.assertTrue(DIR_TOP <= code <= DIR_DOWN_RIGHT, name)
+
+    def test_invalid_direction_returns_false(self):
+        board = Board()
+        p1 = board.p1
+        for direction in ('bogus', '', 99, -1, DIR_DOWN_RIGHT + 1, None):
+            self.assertFalse(p1.move(direction), repr(direction))
+            self.assertEqual(p1.pos, (16, 8))
+
+    def test_step_off_board_returns_false(self):
+        board = Board()
+        self.assertFalse(board.p1.move('down'))
+        self.assertEqual(board.p1.pos, (16, 8))
+
+
+class JumpTest(unittest.TestCase):
+
+    def test_straight_jump_over_opponent(self):
+        board = _board_with_pawns((10, 8), (8, 8))
+        self.assertTrue(board.p1.move('up'))
+        self.assertEqual(board.p1.pos, (6, 8))
+        self.assertEqual(board.board[8, 8], board.p2.id)
+
+    def test_jump_blocked_by_wall_behind_opponent(self):
+        board = _board_with_pawns((10, 8), (8, 8))
+        _place_horizontal_wall(board, 7, 9)
+        self.assertFalse(board.p1.move('up'))
+        self.assertEqual(board.p1.pos, (10, 8))
+
+    def test_diagonal_side_step_when_jump_blocked(self):
+        board = _board_with_pawns((10, 8), (8, 8))
+        _place_horizontal_wall(board, 7, 9)
+        self.assertTrue(board.p1.move(DIR_TOP_LEFT))
+        self.assertEqual(board.p1.pos, (8, 6))
+
+    def test_diagonal_needs_adjacent_opponent(self):
+        board = _board_with_pawns((10, 8), (2, 8))
+        self.assertFalse(board.p1.move('topRight'))
+        self.assertEqual(board.p1.pos, (10, 8))
+
+    def test_move_to_position_jump_target(self):
+        board = _board_with_pawns((10, 8), (8, 8))
+        self.assertTrue(board.p1.move_to_position(6, 8))
+        self.assertEqual(board.p1.pos, (6, 8))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,228 @@
+"""
+Regression tests for AI/search.py.
+
+The search layers a transposition table, killer/history ordering and
+several per-layout caches on top of plain alpha-beta. These tests check
+that none of that changes what the search decides, by comparing against
+uncached reference computations on fixed, seeded positions.
+"""
+
+import math
+import random
+import unittest
+from collections import deque
+from unittest import mock
+
+from core.Board import Board
+import AI.search as search
+from AI.move_generator import generate_all_moves
+
+
+def _random_positions(seed, plies, every=3):
+    """Yield the board every few plies of a seeded random game (P1 to move first)."""
+    rng = random.Random(seed)
+    board = Board(vs_ai=True, ai_difficulty='hard')
+    for ply in range(plies):
+        player = board.p1 if ply % 2 == 0 else board.p2
+        moves = generate_all_moves(board, player)
+        # Mostly pawn moves toward the goal, so games do not stall in walls
+        pawns = [m for m in moves if m[0] == 'pawn']
+        if pawns and rng.random() < 0.7:
+            pawns.sort(key=lambda m: abs(m[1][0] - player.objective))
+            move = pawns[0] if rng.random() < 0.7 else rng.choice(pawns)
+        else:
+            move = rng.choice(moves)
+        search.apply_move_to_board(board, move, player)
+        if player.y == player.objective:
+            return
+        if ply % 2 == 0 and ply % every == 0:
+            yield board
+
+
+def _reset_search_state():
+    """Start from empty caches, as find_best_move does."""
+    for cache in (search._TRANSPOSITION_TABLE, search._KILLER_MOVES,
+                  search._DISTANCE_FIELDS, search._REPEAT_PENALTIES,
+                  search._FREE_WALL_SLOTS, search._NEIGHBOR_CACHE,
+                  search._REACHABLE_CACHE, search._WALL_PRIORITIES,
+                  search._PATH_WALL_CENTERS) + search._HISTORY_SCORES:
+        cache.clear()
+
+
+def _reference_root_values(board, depth, wall_bonus_weight):
+    """
+    Value of every AI root move from a full-window search of each child,
+    with the transposition table and the killer/history tables switched off.
+    """
+    _reset_search_state()
+    virtual_board = search._create_virtual_board(board)
+    values = {}
+    with mock.patch.object(search, '_store_tt_entry'), \
+            mock.patch.object(search, '_record_cutoff'):
+        for move in search._get_valid_moves_virtual(board, virtual_board, True):
+            undo = search._make_move_virtual(board, virtual_board, move, True)
+            values[move] = search._alpha_beta(board, virtual_board, depth - 1,
+                                              -math.inf, math.inf, False, wall_bonus_weight)
+            search._unmake_move_virtual(virtual_board, undo)
+    return values
+
+
+def _bfs_distances(wall_bits, goal_row, dim):
+    """Plain BFS steps from every pawn cell to the goal row over a wall bitboard."""
+    field = [math.inf] * (dim * dim)
+    queue = deque()
+    for x in range(0, dim, 2):
+        field[goal_row * dim + x] = 0
+        queue.append((goal_row, x))
+    while queue:
+        y, x = queue.popleft()
+        for dy, dx in ((-2, 0), (2, 0), (0, -2), (0, 2)):
+            ny, nx = y + dy, x + dx
+            if not (0 <= ny < dim and 0 <= nx < dim):
+                continue
+            if wall_bits >> ((y + dy // 2) * dim + x + dx // 2) & 1:
+                continue
+            if field[ny * dim + nx] == math.inf:
+                field[ny * dim + nx] = field[y * dim + x] + 1
+                queue.append((ny, nx))
+    return field
+
+
+def _random_wall_bits(rng, dim, count):
+    """A bitboard of up to `count` non-overlapping walls, legal or not."""
+    bits = 0
+    slots = search._wall_slots(dim)
+    for _ in range(count):
+        y, x, center_bit, _, h_mask, _, v_mask = rng.choice(slots)
+        mask = h_mask if rng.random() < 0.5 else v_mask
+        if not bits & (mask | center_bit):
+            bits |= mask
+    return bits
+
+
+class FindBestMoveTest(unittest.TestCase):
+
+    def _check_against_reference(self, depth, seeds):
+        checked = 0
+        for seed in seeds:
+            for board in _random_positions(seed, 30):
+                move = search.find_best_move(board, board.p2, depth, 1.5)
+                values = _reference_root_values(board, depth, 1.5)
+                if move[0] == 'pawn' and move[1][0] == board.p2.objective:
+                    # Instant wins are returned before any search
+                    continue
+                self.assertEqual(values[move], max(values.values()),
+                                 f"seed {seed}: {move} is not a best move at depth {depth}")
+                checked += 1
+        self.assertGreater(checked, 0)
+
+    def test_depth_2_matches_uncached_reference(self):
+        self._check_against_reference(2, range(4))
+
+    def test_depth_3_matches_uncached_reference(self):
+        self._check_against_reference(3, range(2))
+
+    def test_null_move_keeps_chosen_moves(self):
+        for seed in range(6):
+            for board in _random_positions(seed, 40, every=2):
+                move = search.find_best_move(board, board.p2, 3, 1.5)
+                with mock.patch.object(search, 'NULL_MOVE_MIN_DEPTH', math.inf):
+                    self.assertEqual(search.find_best_move(board, board.p2, 3, 1.5), move,
+                                     f"seed {seed}: null move changed the chosen move")
+
+
+def _board_with(p1_pos, p1_walls, ai_pos, ai_walls, walls):
+    """A board with the pawns and wall counts given and `walls` (lists of 3 cells) placed."""
+    board = Board(vs_ai=True, ai_difficulty='hard')
+    for player, (y, x), count in ((board.p1, p1_pos, p1_walls), (board.p2, ai_pos, ai_walls)):
+        board.board[player.y, player.x] = 0
+        player.y, player.x = y, x
+        board.board[y, x] = player.id
+        player.available_walls = count
+    for cells in walls:
+        search.apply_move_to_board(board, (search.WALL_MOVE_CODE, cells), board.p1)
+        board.p1.available_walls += 1
+    return board
+
+
+# Reached after 6 moves each from a seeded game against a scripted opponent.
+# Depth 2 used to score the AI's step to (14, 8) as a win, because the leaf
+# saw the AI one step from its goal and P1's reply had been pawn-only.
+SEED_4_WALLS = (((1, 2), (1, 3), (1, 4)), ((3, 6), (3, 7), (3, 8)),
+                ((3, 10), (3, 11), (3, 12)), ((8, 15), (9, 15), (10, 15)))
+
+
+class QuiescenceTest(unittest.TestCase):
+
+    def _quiescence(self, p1_walls, walls_searched):
+        _reset_search_state()
+        board = _board_with((8, 8), p1_walls, (14, 8), 9, ())
+        virtual_board = search._create_virtual_board(board)
+        return search._quiescence(board, virtual_board, -math.inf, math.inf, True, 1.5,
+                                  search.QUIESCENCE_DEPTH, walls_searched)
+
+    def test_win_needs_opponent_walls_searched(self):
+        self.assertEqual(self._quiescence(7, True), math.inf)
+        self.assertFalse(math.isinf(self._quiescence(7, False)))
+
+    def test_win_counts_when_opponent_has_no_walls(self):
+        self.assertEqual(self._quiescence(0, False), math.inf)
+
+    def test_seed_4_position_is_not_a_false_win(self):
+        board = _board_with((8, 8), 7, (12, 8), 9, SEED_4_WALLS)
+        step = (search.PAWN_MOVE_CODE, (14, 8))
+        self.assertFalse(math.isinf(_reference_root_values(board, 2, 1.5)[step]))
+        values = _reference_root_values(board, 3, 1.5)
+        move = search.find_best_move(board, board.p2, 3, 1.5)
+        self.assertEqual(values[move], max(values.values()))
+
+
+class PathsOpenBitsTest(unittest.TestCase):
+
+    def test_matches_plain_bfs(self):
+        dim = 17
+        rng = random.Random(7)
+        cells = [(y, x) for y in range(0, dim, 2) for x in range(0, dim, 2)]
+        for _ in range(300):
+            wall_bits = _random_wall_bits(rng, dim, rng.randrange(4, 30))
+            p1 = rng.choice(cells)
+            p2 = rng.choice(cells)
+            field_p1 = _bfs_distances(wall_bits, 0, dim)
+            field_p2 = _bfs_distances(wall_bits, dim - 1, dim)
+            expected = (field_p1[p1[0] * dim + p1[1]] != math.inf and
+                        field_p2[p2[0] * dim + p2[1]] != math.inf)
+            self.assertEqual(search._paths_open_bits(wall_bits, p1, 0, p2, dim - 1, dim),
+                             expected)
+
+
+class InheritDistanceFieldsTest(unittest.TestCase):
+
+    def test_inherited_fields_match_plain_bfs(self):
+        rng = random.Random(11)
+        inherited = 0
+        for _ in range(60):
+            _reset_search_state()
+            board = Board(vs_ai=True, ai_difficulty='hard')
+            dim = board.dimBoard
+            goals = (board.p1.objective, board.p2.objective)
+            virtual_board = search._create_virtual_board(board)
+
+            # Play random walls, checking whatever each one inherited
+            for _ in range(12):
+                for goal in goals:
+                    search._distance_field(virtual_board, goal, dim)
+                free = [(h, v) for _, _, h, v in search._free_wall_slots(virtual_board[4], dim)]
+                move = rng.choice([m for pair in free for m in pair if m is not None])
+                parent_bits = virtual_board[4]
+                search._make_move_virtual(board, virtual_board, move, True)
+                for goal in goals:
+                    field = search._DISTANCE_FIELDS.get((virtual_board[4], goal))
+                    if field is not None:
+                        self.assertIs(field, search._DISTANCE_FIELDS[(parent_bits, goal)])
+                        self.assertEqual(field, _bfs_distances(virtual_board[4], goal, dim))
+                        inherited += 1
+        self.assertGreater(inherited, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()